@@ -2,22 +2,24 @@
 # Contains all analysis modules for TPB framework implementation
 
 from .text_analyzer import TextAnalyzer
-from .cultural_sensitivity_detector import CulturalSensitivityDetector
+from .cultural_sensitivity_detector import CulturalSensitivityDetector, get_cultural_sensitivity_detector
 from .perceived_intent_calculator import PerceivedIntentCalculator
 from .tpb_calculator import TPBCalculator
 from .outcome_predictor import OutcomePredictor
 from .recommendation_engine import RecommendationEngine
-from .image_analyzer import ImageAnalyzer
+from .image_analyzer import ImageAnalyzer, get_image_analyzer
 from .multimodal_fusion import MultiModalFusion, fuse_text_and_image_analysis
 
 __all__ = [
     'TextAnalyzer', 
     'CulturalSensitivityDetector', 
+    'get_cultural_sensitivity_detector',
     'PerceivedIntentCalculator', 
     'TPBCalculator', 
     'OutcomePredictor', 
     'RecommendationEngine', 
     'ImageAnalyzer',
+    'get_image_analyzer',
     'MultiModalFusion',
     'fuse_text_and_image_analysis'
 ]
@@ -1,11 +1,32 @@
 # AdsenseAI Campaign Risk Analyzer - Cultural Sensitivity Detector Module
 # Detects cultural triggers and festival proximity for Indian market
 
-import re
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+import copy
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set
+from datetime import datetime
 from app.data.data_loader import get_data_loader
 
+try:
+    import ahocorasick
+except ImportError:
+    # Fall back to a pure-Python prefix trie when pyahocorasick is not installed
+    ahocorasick = None
+
+# Key marking a complete needle in the fallback prefix trie
+TRIE_END = ''
+
+# Number of SCS results kept for repeated analyses of the same content
+SCS_CACHE_SIZE = 1024
+
+# Severity levels in breakdown order; indices below NORM_VIOLATION_LEVELS
+# (critical and high) count as norm violations
+SEVERITY_LEVELS = ('critical', 'high', 'medium', 'low')
+SEVERITY_INDEX = {severity: idx for idx, severity in enumerate(SEVERITY_LEVELS)}
+NORM_VIOLATION_LEVELS = 2
+
 
 class CulturalSensitivityDetector:
     """
@@ -18,6 +39,15 @@ class CulturalSensitivityDetector:
         self.data_loader = get_data_loader()
         self._cultural_triggers = None
         self._festival_calendar = None
+        self._festival_entries = []
+        self._festivals_by_ordinal = {}
+        self._automaton = None
+        self._trie = None
+        # Set only once the data, festival index and automaton are all built
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        self._scs_cache = OrderedDict()
+        self._scs_cache_lock = threading.Lock()
         
         # CRITICAL FIX 1: Compound pattern detection for harmful framing
         # Detects combinations of triggers + amplifiers + solutions that compound harm
@@ -51,50 +81,215 @@ class CulturalSensitivityDetector:
     
     def _load_data(self):
         """Load cultural triggers and festival calendar if not already loaded"""
-        if self._cultural_triggers is None:
-            self._cultural_triggers = self.data_loader.load_cultural_triggers()
-        if self._festival_calendar is None:
-            self._festival_calendar = self.data_loader.load_festival_calendar()
+        if self._loaded:
+            return
+        # Concurrent first calls wait for one load instead of reading it half-built
+        with self._load_lock:
+            if self._loaded:
+                return
+            if self._cultural_triggers is None:
+                self._cultural_triggers = self.data_loader.load_cultural_triggers()
+            if self._festival_calendar is None:
+                self._festival_calendar = self.data_loader.load_festival_calendar()
+                self._prepare_festivals()
+            self._build_automaton()
+            self._loaded = True
     
-    def detect_compound_patterns(self, text: str) -> List[Dict]:
+    def _prepare_festivals(self):
         """
-        CRITICAL FIX 1: Detect compound harmful patterns.
+        Parse festival dates and lowercase sensitivity keywords once, and
+        index festivals by date ordinal so proximity checks only look up
+        the days around the posting date.
+        """
+        self._festival_entries = []
+        self._festivals_by_ordinal = {}
         
-        Identifies combinations of primary triggers + amplifiers + solutions
-        that compound harm (e.g., colorism discrimination).
+        for festival in self._festival_calendar:
+            try:
+                festival_date = datetime.strptime(festival.get('date_2025', ''), '%Y-%m-%d').date()
+            except (ValueError, TypeError):
+                # Skip festivals with invalid dates
+                continue
+            
+            sensitivity_keywords = [
+                (keyword, keyword.lower())
+                for keyword in festival.get('sensitivity_keywords', [])
+                if keyword
+            ]
+            self._festivals_by_ordinal.setdefault(festival_date.toordinal(), []).append(
+                len(self._festival_entries)
+            )
+            self._festival_entries.append((festival, festival_date, sensitivity_keywords))
+    
+    def _build_automaton(self):
+        """
+        Build a single Aho-Corasick automaton over all trigger keywords,
+        compound pattern terms and festival sensitivity keywords so text can
+        be scanned once per analysis.
+        Falls back to a prefix trie when pyahocorasick is not installed.
+        """
+        # Several triggers/terms may share a needle; keep every tag
+        needles = {}
+        for idx, trigger in enumerate(self._cultural_triggers):
+            keyword = trigger.get('keyword', '').lower()
+            if keyword:
+                needles.setdefault(keyword, []).append(('trigger', idx))
+        
+        for pattern_name, pattern_def in self.HARMFUL_PATTERNS.items():
+            for role in ('primary', 'amplifiers', 'solutions'):
+                for term in pattern_def[role]:
+                    needles.setdefault(term, []).append(('compound', pattern_name, role, term))
+        
+        festival_keywords = {
+            keyword_lower
+            for _, _, sensitivity_keywords in self._festival_entries
+            for _, keyword_lower in sensitivity_keywords
+        }
+        for keyword_lower in festival_keywords:
+            needles.setdefault(keyword_lower, []).append(('festival', keyword_lower))
+        
+        if ahocorasick is None:
+            self._automaton = None
+            self._trie = self._build_trie(needles)
+            return
+        
+        automaton = ahocorasick.Automaton()
+        for needle, tags in needles.items():
+            automaton.add_word(needle, (len(needle), tags))
+        automaton.make_automaton()
+        self._automaton = automaton
+    
+    @staticmethod
+    def _build_trie(needles: Dict[str, List[tuple]]) -> Dict:
+        """
+        Build a prefix trie of nested dicts keyed by character. Nodes that
+        complete a needle store (length, tags) under TRIE_END.
+        """
+        trie = {}
+        for needle, tags in needles.items():
+            node = trie
+            for char in needle:
+                node = node.setdefault(char, {})
+            node[TRIE_END] = (len(needle), tags)
+        return trie
+    
+    def _iter_matches(self, text_lower: str):
+        """
+        Iterate over every needle occurrence in the text.
+        
+        Yields:
+            Tuples of (end_index, (length, tags)), as produced by
+            ahocorasick.Automaton.iter
+        """
+        if self._automaton is not None:
+            return self._automaton.iter(text_lower)
+        return self._iter_trie_matches(text_lower)
+    
+    def _iter_trie_matches(self, text_lower: str):
+        """Walk the prefix trie from every position of the text"""
+        trie = self._trie
+        text_len = len(text_lower)
+        
+        for start in range(text_len):
+            node = trie.get(text_lower[start])
+            end = start
+            
+            while node is not None:
+                match = node.get(TRIE_END)
+                if match is not None:
+                    yield end, match
+                
+                end += 1
+                if end >= text_len:
+                    break
+                node = node.get(text_lower[end])
+    
+    @staticmethod
+    def _is_word_char(char: str) -> bool:
+        """Check whether a character counts as a word character for regex word boundaries"""
+        return char.isalnum() or char == '_'
+    
+    def _scan_text(self, text_lower: str) -> Dict:
+        """
+        Scan text once for cultural trigger keywords, compound pattern terms
+        and festival sensitivity keywords.
+        
+        Trigger keywords must match as whole words; compound pattern terms
+        and festival keywords match as plain substrings.
         
         Args:
-            text: Text content to analyze
+            text_lower: Lowercased text content
+            
+        Returns:
+            Dictionary with matched trigger indices, compound pattern hits
+            keyed by pattern name and then role, and matched festival keywords
+        """
+        trigger_hits = set()
+        compound_hits = {}
+        festival_hits = set()
+        
+        text_len = len(text_lower)
+        for end, (length, tags) in self._iter_matches(text_lower):
+            whole_word = None
+            
+            for tag in tags:
+                kind = tag[0]
+                if kind == 'trigger':
+                    # Use word boundary matching to avoid partial matches
+                    if whole_word is None:
+                        start = end - length + 1
+                        whole_word = not (
+                            (start > 0 and self._is_word_char(text_lower[start - 1])) or
+                            (end + 1 < text_len and self._is_word_char(text_lower[end + 1]))
+                        )
+                    if whole_word:
+                        trigger_hits.add(tag[1])
+                elif kind == 'compound':
+                    _, pattern_name, role, term = tag
+                    compound_hits.setdefault(pattern_name, {}).setdefault(role, set()).add(term)
+                else:
+                    festival_hits.add(tag[1])
+        
+        return {
+            'triggers': trigger_hits,
+            'compound': compound_hits,
+            'festival_keywords': festival_hits
+        }
+    
+    def _build_compound_patterns(self, compound_hits: Dict[str, Dict[str, Set[str]]]) -> List[Dict]:
+        """
+        Score compound harmful patterns from the terms found by _scan_text.
+        
+        Args:
+            compound_hits: Compound pattern hits keyed by pattern name and role
             
         Returns:
             List of detected compound pattern dictionaries
         """
-        if not text or not text.strip():
+        # Most ad copy mentions none of the primary terms
+        if not compound_hits:
             return []
         
-        text_lower = text.lower()
         detected_patterns = []
         
         for pattern_name, pattern_def in self.HARMFUL_PATTERNS.items():
-            # Check for primary trigger
-            primary_found = any(
-                primary in text_lower 
-                for primary in pattern_def['primary']
-            )
+            hits = compound_hits.get(pattern_name)
             
-            if not primary_found:
+            # Check for primary trigger
+            if not hits or not hits.get('primary'):
                 continue
             
-            # Check for amplifiers
+            # Check for amplifiers and solutions, keeping definition order
+            amplifiers_hit = hits.get('amplifiers', ())
             amplifiers_found = [
                 amp for amp in pattern_def['amplifiers']
-                if amp in text_lower
+                if amp in amplifiers_hit
             ]
             
-            # Check for solutions
+            solutions_hit = hits.get('solutions', ())
             solutions_found = [
                 sol for sol in pattern_def['solutions']
-                if sol in text_lower
+                if sol in solutions_hit
             ]
             
             # Compound pattern detected if primary + (amplifiers OR solutions)
@@ -122,13 +317,37 @@ class CulturalSensitivityDetector:
         
         return detected_patterns
     
-    def detect_triggers(self, text: str, image_analysis: Optional[Dict] = None) -> List[Dict]:
+    def detect_compound_patterns(self, text: str, text_lower: Optional[str] = None) -> List[Dict]:
+        """
+        CRITICAL FIX 1: Detect compound harmful patterns.
+        
+        Identifies combinations of primary triggers + amplifiers + solutions
+        that compound harm (e.g., colorism discrimination).
+        
+        Args:
+            text: Text content to analyze
+            text_lower: Optional precomputed text.lower()
+            
+        Returns:
+            List of detected compound pattern dictionaries
+        """
+        if not text or not text.strip():
+            return []
+        
+        self._load_data()
+        
+        scan = self._scan_text(text_lower if text_lower is not None else text.lower())
+        return self._build_compound_patterns(scan['compound'])
+    
+    def detect_triggers(self, text: str, image_analysis: Optional[Dict] = None,
+                        text_lower: Optional[str] = None) -> List[Dict]:
         """
         Detect cultural triggers in text and optionally image analysis results.
         
         Args:
             text: Text content to analyze
             image_analysis: Optional image analysis results from Gemini API
+            text_lower: Optional precomputed text.lower()
             
         Returns:
             List of detected trigger dictionaries with details
@@ -140,40 +359,52 @@ class CulturalSensitivityDetector:
         if not text or not text.strip():
             return []
         
+        if text_lower is None:
+            text_lower = text.lower()
+        
+        return self._triggers_from_scan(self._scan_text(text_lower), image_analysis)
+    
+    def _triggers_from_scan(self, scan: Dict, image_analysis: Optional[Dict] = None) -> List[Dict]:
+        """
+        Build detected trigger dictionaries from a _scan_text result.
+        
+        Args:
+            scan: Result of _scan_text for the analyzed text
+            image_analysis: Optional image analysis results from Gemini API
+            
+        Returns:
+            List of detected trigger dictionaries with details
+        """
         detected_triggers = []
-        text_lower = text.lower()
         
         # CRITICAL FIX 1: Check compound patterns FIRST (highest priority)
-        compound_patterns = self.detect_compound_patterns(text)
+        compound_patterns = self._build_compound_patterns(scan['compound'])
         detected_triggers.extend(compound_patterns)
         
-        # Check each cultural trigger
-        for trigger in self._cultural_triggers:
-            keyword = trigger.get('keyword', '').lower()
-            
-            # Use word boundary matching to avoid partial matches
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            
-            if re.search(pattern, text_lower):
-                detected_triggers.append({
-                    'keyword': trigger.get('keyword', ''),
-                    'category': trigger.get('category', ''),
-                    'severity': trigger.get('severity', ''),
-                    'risk_weight': trigger.get('risk_weight', 0),
-                    'message': trigger.get('alert_message', ''),
-                    'source': 'text'
-                })
+        # Check each matched cultural trigger
+        for idx in sorted(scan['triggers']):
+            trigger = self._cultural_triggers[idx]
+            detected_triggers.append({
+                'keyword': trigger.get('keyword', ''),
+                'category': trigger.get('category', ''),
+                'severity': trigger.get('severity', ''),
+                'risk_weight': trigger.get('risk_weight', 0),
+                'message': trigger.get('alert_message', ''),
+                'source': 'text'
+            })
         
         # Check image analysis for visual triggers if provided
         if image_analysis:
             sensitivity_flags = image_analysis.get('sensitivity_flags', [])
             for flag in sensitivity_flags:
+                severity = flag.get('severity', 'medium')
+                
                 # Add visual triggers with appropriate risk weights
                 detected_triggers.append({
                     'keyword': flag.get('element', 'visual_element'),
                     'category': flag.get('category', 'Visual'),
-                    'severity': flag.get('severity', 'medium'),
-                    'risk_weight': self._get_visual_risk_weight(flag.get('severity', 'medium')),
+                    'severity': severity,
+                    'risk_weight': self._get_visual_risk_weight(severity.lower()),
                     'message': flag.get('message', 'Visual sensitivity detected'),
                     'source': 'image'
                 })
@@ -185,7 +416,7 @@ class CulturalSensitivityDetector:
         Get risk weight for visual triggers based on severity
         
         Args:
-            severity: Severity level (critical, high, medium, low)
+            severity: Lowercase severity level (critical, high, medium, low)
             
         Returns:
             Risk weight integer
@@ -196,9 +427,10 @@ class CulturalSensitivityDetector:
             'medium': 20,
             'low': 10
         }
-        return severity_weights.get(severity.lower(), 15)
+        return severity_weights.get(severity, 15)
     
-    def check_festival_proximity(self, posting_date: str, content: str) -> List[Dict]:
+    def check_festival_proximity(self, posting_date: str, content: str,
+                                 content_lower: Optional[str] = None) -> List[Dict]:
         """
         Check if posting date is near sensitive festivals and if content
         conflicts with festival sensitivities.
@@ -206,6 +438,7 @@ class CulturalSensitivityDetector:
         Args:
             posting_date: Posting date in YYYY-MM-DD format
             content: Text content to check for keyword conflicts
+            content_lower: Optional precomputed content.lower()
             
         Returns:
             List of festival proximity alerts
@@ -217,62 +450,75 @@ class CulturalSensitivityDetector:
         if not posting_date or not content:
             return []
         
+        if content_lower is None:
+            content_lower = content.lower()
+        
+        return self._festival_alerts_from_scan(posting_date, self._scan_text(content_lower))
+    
+    def _festival_alerts_from_scan(self, posting_date: str, scan: Dict) -> List[Dict]:
+        """
+        Build festival proximity alerts from a _scan_text result.
+        
+        Args:
+            posting_date: Posting date in YYYY-MM-DD format
+            scan: Result of _scan_text for the content
+            
+        Returns:
+            List of festival proximity alerts
+        """
         try:
-            # Parse posting date
-            post_date = datetime.strptime(posting_date, '%Y-%m-%d')
+            # Parse posting date (strptime also accepts unpadded months/days)
+            post_date = datetime.strptime(posting_date, '%Y-%m-%d').date()
         except (ValueError, TypeError):
             # Invalid date format
             return []
         
         alerts = []
-        content_lower = content.lower()
+        festival_hits = scan['festival_keywords']
+        
+        # Only festivals within 7 days of the posting date can raise alerts
+        post_ordinal = post_date.toordinal()
+        nearby = sorted(
+            idx
+            for offset in range(-7, 8)
+            for idx in self._festivals_by_ordinal.get(post_ordinal + offset, [])
+        )
         
-        # Check each festival
-        for festival in self._festival_calendar:
-            try:
-                # Parse festival date
-                festival_date_str = festival.get('date_2025', '')
-                festival_date = datetime.strptime(festival_date_str, '%Y-%m-%d')
+        # Check each nearby festival in calendar order
+        for idx in nearby:
+            festival, festival_date, sensitivity_keywords = self._festival_entries[idx]
+            
+            # Calculate days difference
+            days_diff = abs((festival_date - post_date).days)
+            festival_name = festival.get('festival_name', '')
+            
+            # Check if content contains conflicting keywords
+            conflicts = []
+            for keyword, keyword_lower in sensitivity_keywords:
+                if keyword_lower in festival_hits:
+                    conflicts.append(keyword)
+            
+            # ONLY add alert if there are actual conflicts
+            # Festival proximity without conflicts is not a risk
+            if conflicts:
+                # Determine severity based on proximity
+                severity = 'critical' if days_diff <= 3 else 'high'
+                risk_weight = 35 if days_diff <= 3 else 25
                 
-                # Calculate days difference
-                days_diff = abs((festival_date - post_date).days)
+                alert = {
+                    'festival': festival_name,
+                    'festival_date': festival.get('date_2025', ''),
+                    'days_away': days_diff,
+                    'severity': severity,
+                    'risk_weight': risk_weight,
+                    'conflicts': conflicts,
+                    'message': self._generate_festival_message(
+                        festival_name, days_diff, conflicts
+                    ),
+                    'description': festival.get('description', '')
+                }
                 
-                # Alert if within 7 days
-                if days_diff <= 7:
-                    festival_name = festival.get('festival_name', '')
-                    sensitivity_keywords = festival.get('sensitivity_keywords', [])
-                    
-                    # Check if content contains conflicting keywords
-                    conflicts = []
-                    for keyword in sensitivity_keywords:
-                        if keyword.lower() in content_lower:
-                            conflicts.append(keyword)
-                    
-                    # ONLY add alert if there are actual conflicts
-                    # Festival proximity without conflicts is not a risk
-                    if conflicts:
-                        # Determine severity based on proximity
-                        severity = 'critical' if days_diff <= 3 else 'high'
-                        risk_weight = 35 if days_diff <= 3 else 25
-                        
-                        alert = {
-                            'festival': festival_name,
-                            'festival_date': festival_date_str,
-                            'days_away': days_diff,
-                            'severity': severity,
-                            'risk_weight': risk_weight,
-                            'conflicts': conflicts,
-                            'message': self._generate_festival_message(
-                                festival_name, days_diff, conflicts
-                            ),
-                            'description': festival.get('description', '')
-                        }
-                        
-                        alerts.append(alert)
-                    
-            except (ValueError, TypeError, KeyError):
-                # Skip festivals with invalid dates
-                continue
+                alerts.append(alert)
         
         return alerts
     
@@ -298,23 +544,70 @@ class CulturalSensitivityDetector:
                    f"Ensure messaging is appropriate and respectful.")
     
     def calculate_scs_score(self, text: str, posting_date: Optional[str] = None,
-                           image_analysis: Optional[Dict] = None) -> Dict:
+                           image_analysis: Optional[Dict] = None,
+                           text_lower: Optional[str] = None) -> Dict:
         """
         Calculate Socio-Cultural Sensitivity (SCS) score.
         
         Aggregates trigger risk weights, festival proximity penalties,
-        and norm violation indicators.
+        and norm violation indicators. Results are cached per
+        (text, posting_date, image_analysis) so repeated analyses of the
+        same campaign skip detection.
         
         Args:
             text: Text content to analyze
             posting_date: Optional posting date for festival proximity check
             image_analysis: Optional image analysis results
+            text_lower: Optional precomputed text.lower()
             
         Returns:
             Dictionary containing SCS score and component breakdowns
             
         Requirements: 3.4, 3.5
         """
+        image_key = None
+        if image_analysis is not None:
+            image_key = json.dumps(image_analysis, sort_keys=True, default=str)
+        cache_key = (text, posting_date, image_key)
+        
+        with self._scs_cache_lock:
+            result = self._scs_cache.get(cache_key)
+            if result is not None:
+                self._scs_cache.move_to_end(cache_key)
+        
+        if result is None:
+            result = self._calculate_scs_score(text, posting_date, image_analysis, text_lower)
+            with self._scs_cache_lock:
+                self._scs_cache[cache_key] = result
+                if len(self._scs_cache) > SCS_CACHE_SIZE:
+                    self._scs_cache.popitem(last=False)
+        
+        # Callers adjust the result in place, so never hand out the cached copy
+        return copy.deepcopy(result)
+    
+    def calculate_scs_score_batch(self, items: List[Dict]) -> List[Dict]:
+        """
+        Calculate SCS scores for several campaigns in one call.
+        
+        Args:
+            items: List of dictionaries with 'text' and optional
+                'posting_date' and 'image_analysis' keys
+            
+        Returns:
+            List of SCS result dictionaries in input order
+        """
+        self._load_data()
+        
+        calculate = self.calculate_scs_score
+        return [
+            calculate(item.get('text', ''), item.get('posting_date'), item.get('image_analysis'))
+            for item in items
+        ]
+    
+    def _calculate_scs_score(self, text: str, posting_date: Optional[str] = None,
+                            image_analysis: Optional[Dict] = None,
+                            text_lower: Optional[str] = None) -> Dict:
+        """Calculate the SCS score without consulting the result cache"""
         if not text or not text.strip():
             return {
                 'scs_score': 0.0,
@@ -331,29 +624,49 @@ class CulturalSensitivityDetector:
                 }
             }
         
+        self._load_data()
+        
+        # Lowercase and scan the text once for trigger and festival detection
+        if text_lower is None:
+            text_lower = text.lower()
+        scan = self._scan_text(text_lower)
+        
         # Detect cultural triggers
-        detected_triggers = self.detect_triggers(text, image_analysis)
+        detected_triggers = self._triggers_from_scan(scan, image_analysis)
         
         # Check festival proximity if date provided
         festival_alerts = []
         if posting_date:
-            festival_alerts = self.check_festival_proximity(posting_date, text)
+            festival_alerts = self._festival_alerts_from_scan(posting_date, scan)
+        
+        # Aggregate risk weights, norm violations and the severity breakdown
+        # in one pass per list. Festival and compound severities are built
+        # lowercase; trigger data and image flags are lowercased only when
+        # they do not match as-is.
+        severity_counts = [0, 0, 0, 0]
+        norm_violations = 0
         
         # Calculate total risk weight from triggers
-        trigger_risk = sum(trigger.get('risk_weight', 0) for trigger in detected_triggers)
+        trigger_risk = 0
+        for trigger in detected_triggers:
+            trigger_risk += trigger.get('risk_weight', 0)
+            severity = trigger.get('severity', '')
+            severity_idx = SEVERITY_INDEX.get(severity)
+            if severity_idx is None:
+                severity_idx = SEVERITY_INDEX.get(severity.lower())
+            if severity_idx is not None:
+                severity_counts[severity_idx] += 1
+                if severity_idx < NORM_VIOLATION_LEVELS:
+                    norm_violations += 1
         
         # Calculate festival proximity penalty
-        festival_risk = sum(alert.get('risk_weight', 0) for alert in festival_alerts)
-        
-        # Count norm violations (critical and high severity triggers)
-        norm_violations = sum(
-            1 for trigger in detected_triggers
-            if trigger.get('severity', '').lower() in ['critical', 'high']
-        )
-        norm_violations += sum(
-            1 for alert in festival_alerts
-            if alert.get('severity', '').lower() in ['critical', 'high']
-        )
+        festival_risk = 0
+        for alert in festival_alerts:
+            festival_risk += alert.get('risk_weight', 0)
+            severity_idx = SEVERITY_INDEX[alert['severity']]
+            severity_counts[severity_idx] += 1
+            if severity_idx < NORM_VIOLATION_LEVELS:
+                norm_violations += 1
         
         # Norm violation penalty
         norm_violation_penalty = norm_violations * 10
@@ -363,22 +676,7 @@ class CulturalSensitivityDetector:
         scs_score = min(scs_score, 100)  # Cap at 100
         
         # Count severity breakdown
-        severity_breakdown = {
-            'critical': 0,
-            'high': 0,
-            'medium': 0,
-            'low': 0
-        }
-        
-        for trigger in detected_triggers:
-            severity = trigger.get('severity', '').lower()
-            if severity in severity_breakdown:
-                severity_breakdown[severity] += 1
-        
-        for alert in festival_alerts:
-            severity = alert.get('severity', '').lower()
-            if severity in severity_breakdown:
-                severity_breakdown[severity] += 1
+        severity_breakdown = dict(zip(SEVERITY_LEVELS, severity_counts))
         
         return {
             'scs_score': round(scs_score, 2),
@@ -428,3 +726,28 @@ class CulturalSensitivityDetector:
             trigger for trigger in self._cultural_triggers
             if trigger.get('category', '').lower() == category_lower
         ]
+
+
+# Global detector instance
+_global_detector: Optional[CulturalSensitivityDetector] = None
+_global_detector_lock = threading.Lock()
+
+
+def get_cultural_sensitivity_detector() -> CulturalSensitivityDetector:
+    """
+    Get global cultural sensitivity detector instance (singleton pattern)
+    
+    Sharing one detector lets request handlers reuse the trigger automaton,
+    festival index and SCS result cache instead of rebuilding them.
+    
+    Returns:
+        CulturalSensitivityDetector instance
+    """
+    global _global_detector
+    
+    if _global_detector is None:
+        with _global_detector_lock:
+            if _global_detector is None:
+                _global_detector = CulturalSensitivityDetector()
+    
+    return _global_detector
@@ -3,14 +3,134 @@
 
 import os
 import base64
+import copy
+import hashlib
+import io
 import json
-from typing import Dict, List, Optional
+import logging
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers are shared
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import diskcache
+except ImportError:
+    # Results are only cached in memory when diskcache is not installed
+    diskcache = None
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    # Images are sent at their original size when Pillow is not installed
+    Image = None
+    ImageOps = None
+
 # Load environment variables
 load_dotenv()
 
+# Bump when prompts change so cached responses from older prompts are not reused
+PROMPT_VERSION = 'v2'
+
+# JSON schemas Gemini's constrained decoder must follow for each request kind
+_STRING_SCHEMA = {'type': 'string'}
+_STRING_LIST_SCHEMA = {'type': 'array', 'items': _STRING_SCHEMA}
+
+ANALYSIS_FIELDS = {
+    'visual_emotions': _STRING_LIST_SCHEMA,
+    'cultural_symbols': _STRING_LIST_SCHEMA,
+    'sensitivity_flags': _STRING_LIST_SCHEMA,
+    'text_overlay': _STRING_SCHEMA,
+    'brand_elements': _STRING_LIST_SCHEMA,
+    'festival_references': _STRING_LIST_SCHEMA,
+    'skin_tone_representation': _STRING_SCHEMA,
+    'emotional_tone': _STRING_SCHEMA,
+    'visual_style': _STRING_SCHEMA,
+    'color_palette': _STRING_LIST_SCHEMA,
+    'composition': _STRING_SCHEMA
+}
+ANALYSIS_RESPONSE_SCHEMA = {
+    'type': 'object',
+    'properties': ANALYSIS_FIELDS,
+    'required': list(ANALYSIS_FIELDS)
+}
+
+OCR_RESPONSE_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'extracted_text': _STRING_SCHEMA,
+        'text_elements': {
+            'type': 'array',
+            'items': {
+                'type': 'object',
+                'properties': {'type': _STRING_SCHEMA, 'text': _STRING_SCHEMA},
+                'required': ['type', 'text']
+            }
+        },
+        'language': _STRING_SCHEMA,
+        'text_confidence': {'type': 'string', 'enum': ['high', 'medium', 'low']}
+    },
+    'required': ['extracted_text', 'text_elements', 'language', 'text_confidence']
+}
+
+COMBINED_RESPONSE_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'analysis': ANALYSIS_RESPONSE_SCHEMA,
+        'ocr_result': OCR_RESPONSE_SCHEMA
+    },
+    'required': ['analysis', 'ocr_result']
+}
+
+# Number of API keys whose shared analyzers get_image_analyzer keeps
+ANALYZER_CACHE_SIZE = 8
+
+# Number of parsed Gemini results kept in memory per analyzer
+RESULT_CACHE_SIZE = 128
+
+# Optional on-disk result cache shared across processes and restarts; off unless
+# ADSENSE_DISK_CACHE is set, since it keeps customer image analyses on disk
+DISK_CACHE_ENABLED = os.getenv('ADSENSE_DISK_CACHE', '').lower() in ('1', 'true', 'yes')
+DISK_CACHE_DIR = os.getenv('ADSENSE_CACHE_DIR', '.adsense_cache')
+DISK_CACHE_SIZE_LIMIT = 2 * 1024 ** 3
+DISK_CACHE_EXPIRE = 30 * 24 * 60 * 60
+
+# Retry policy for transient Gemini failures (rate limits, outages, timeouts)
+MAX_API_ATTEMPTS = 3
+RETRY_BASE_DELAY = 2.0
+RETRY_MAX_DELAY = 30.0
+TRANSIENT_API_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.TooManyRequests,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.DeadlineExceeded,
+    google_exceptions.InternalServerError,
+    TimeoutError,
+    ConnectionError
+)
+
+# Gemini downsamples larger images internally, so send at most this long edge
+MAX_IMAGE_EDGE = 1568
+OPTIMIZED_JPEG_QUALITY = 85
+
+# A text_overlay at least this long makes a separate OCR request unnecessary
+MIN_OVERLAY_TEXT_LENGTH = 10
+
+logger = logging.getLogger(__name__)
+
 
 class ImageAnalyzer:
     """
@@ -28,17 +148,45 @@ class ImageAnalyzer:
     Requirements: 12.1, 12.2
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    # Keyword tiers for visual scoring, each matched as a substring in one regex scan
+    STRONG_TONE_RE = re.compile(r'strong|intense|powerful|vibrant')
+    MODERATE_TONE_RE = re.compile(r'moderate|positive|warm')
+    SUBTLE_TONE_RE = re.compile(r'subtle|calm|gentle')
+    # Sensitivity flag tiers share one scan; critical terms come first so
+    # 'religious conflict' wins over 'religious' at the same position
+    FLAG_TIER_RE = re.compile(
+        r'(?P<critical>colorism|fair skin|skin whitening|religious conflict)'
+        r'|(?P<high>religious|political|caste|communal)'
+        r'|(?P<medium>cultural appropriation|stereotype|insensitive)'
+    )
+    FLAG_TIER_POINTS = {'critical': 40, 'high': 30, 'medium': 20}
+    LOW_FLAG_POINTS = 10
+    EXCLUSIVE_SKIN_TONE_RE = re.compile(r'only fair|only light|lack of diversity|colorism')
+    SKEWED_SKIN_TONE_RE = re.compile(r'predominantly fair|mostly light')
+    CONTROVERSIAL_SYMBOL_RE = re.compile(r'beef|pork|alcohol|religious conflict')
+    
+    def __init__(self, api_key: Optional[str] = None, optimize_images: bool = True,
+                 min_overlay_text_length: int = MIN_OVERLAY_TEXT_LENGTH,
+                 use_disk_cache: Optional[bool] = None):
         """
         Initialize the image analyzer with Gemini API.
         
         Args:
             api_key: Google Gemini API key. If None, reads from GEMINI_API_KEY env variable.
+            optimize_images: Downscale images larger than MAX_IMAGE_EDGE before
+                sending them to Gemini (requires Pillow)
+            min_overlay_text_length: Skip the separate OCR request when visual
+                analysis already returned a text_overlay at least this long
+            use_disk_cache: Persist successful results under DISK_CACHE_DIR
+                so they survive restarts (requires diskcache). Defaults to the
+                ADSENSE_DISK_CACHE environment variable, i.e. off
             
         Requirements: 12.1
         """
         # Get API key from parameter or environment
         self.api_key = api_key or os.getenv('GEMINI_API_KEY')
+        self.optimize_images = optimize_images
+        self.min_overlay_text_length = min_overlay_text_length
         
         if not self.api_key:
             raise ValueError(
@@ -47,17 +195,32 @@ class ImageAnalyzer:
             )
         
         # Configure Gemini API
-        genai.configure(api_key=self.api_key)
+        _configure_api_key(self.api_key)
         
         # Initialize model (gemini-2.5-flash for free tier)
         try:
-            self.model = genai.GenerativeModel('gemini-2.5-flash')
+            self.model_name = 'gemini-2.5-flash'
+            self.model = genai.GenerativeModel(self.model_name)
         except:
             # Fallback to other available models
             try:
-                self.model = genai.GenerativeModel('gemini-flash-latest')
+                self.model_name = 'gemini-flash-latest'
+                self.model = genai.GenerativeModel(self.model_name)
             except:
-                self.model = genai.GenerativeModel('gemini-pro-latest')
+                self.model_name = 'gemini-pro-latest'
+                self.model = genai.GenerativeModel(self.model_name)
+        
+        # Constrain each request kind to schema-valid JSON output
+        self.analysis_config = self._json_generation_config(ANALYSIS_RESPONSE_SCHEMA)
+        self.ocr_config = self._json_generation_config(OCR_RESPONSE_SCHEMA)
+        self.combined_config = self._json_generation_config(COMBINED_RESPONSE_SCHEMA)
+        
+        # Parsed results keyed by image content hash, prompt version and request kind
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        if use_disk_cache is None:
+            use_disk_cache = DISK_CACHE_ENABLED
+        self._disk_cache = self._open_disk_cache() if use_disk_cache else None
         
         # Analysis prompt template
         self.analysis_prompt = """Analyze this marketing image for the Indian market. Provide a detailed analysis in JSON format with the following structure:
@@ -117,6 +280,49 @@ If no text is visible in the image, return:
   "text_confidence": "high"
 }
 
+Provide only the JSON response, no additional text."""
+
+        # Combined prompt covering visual analysis and OCR in one request
+        self.combined_prompt = """Analyze this marketing image for the Indian market and extract ALL text visible in it. Provide a detailed analysis in JSON format with the following structure:
+
+{
+  "analysis": {
+    "visual_emotions": ["list of emotions detected: joy, pride, nostalgia, celebration, inspiration, etc."],
+    "cultural_symbols": ["list of cultural/religious symbols: diya, rangoli, temple, mosque, etc."],
+    "sensitivity_flags": ["list of potential sensitivity issues: colorism, religious imagery, political references, etc."],
+    "text_overlay": "any text visible in the image",
+    "brand_elements": ["list of brand elements: logo, product, packaging, etc."],
+    "festival_references": ["list of festival references: Diwali, Eid, Holi, etc."],
+    "skin_tone_representation": "description of skin tone representation and diversity",
+    "emotional_tone": "overall emotional tone of the imagery",
+    "visual_style": "description of visual style: modern, traditional, minimalist, etc.",
+    "color_palette": ["dominant colors in the image"],
+    "composition": "description of image composition and layout"
+  },
+  "ocr_result": {
+    "extracted_text": "The complete text found in the image, preserving line breaks where appropriate",
+    "text_elements": [
+      {"type": "headline", "text": "Main headline text"},
+      {"type": "body", "text": "Body text content"},
+      {"type": "cta", "text": "Call to action text"},
+      {"type": "hashtag", "text": "#hashtag"},
+      {"type": "brand", "text": "Brand name"}
+    ],
+    "language": "primary language of the text (e.g., English, Hindi, Hinglish)",
+    "text_confidence": "high/medium/low - confidence in text extraction accuracy"
+  }
+}
+
+For "analysis", focus on identifying:
+1. Emotional tone and visual emotions
+2. Cultural and religious symbols that may be sensitive in India
+3. Skin tone representation and potential colorism indicators
+4. Festival or cultural references
+5. Any text overlays or brand messaging
+6. Potential sensitivity triggers for Indian audiences
+
+For "ocr_result", include headlines, body text, captions, brand names, slogans, hashtags, mentions, call-to-action text and any other readable text. If no text is visible, use an empty "extracted_text" and "text_elements", "language": "none" and "text_confidence": "high".
+
 Provide only the JSON response, no additional text."""
     
     def analyze_image(self, image_data: str) -> Dict:
@@ -134,15 +340,33 @@ Provide only the JSON response, no additional text."""
         try:
             # Parse base64 image data
             image_bytes = self._parse_image_data(image_data)
+        except Exception as e:
+            return self._analysis_error_result(str(e))
+        
+        return self._analyze_bytes(image_bytes)
+    
+    def _analyze_bytes(self, image_bytes: bytes) -> Dict:
+        """
+        Run visual analysis on already decoded image bytes.
+        
+        Args:
+            image_bytes: Raw image bytes
             
+        Returns:
+            Dictionary containing visual analysis results
+        """
+        cache_key = self._cache_key(image_bytes, 'analysis')
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
             # Create image part for Gemini
-            image_part = {
-                'mime_type': 'image/jpeg',  # Assume JPEG, Gemini handles most formats
-                'data': image_bytes
-            }
+            image_part = self._image_part(image_bytes)
             
             # Generate content with image and prompt
-            response = self.model.generate_content([self.analysis_prompt, image_part])
+            response = self._generate_content([self.analysis_prompt, image_part],
+                                              self.analysis_config)
             
             # Parse JSON response
             analysis_result = self._parse_gemini_response(response.text)
@@ -155,21 +379,47 @@ Provide only the JSON response, no additional text."""
             visual_scs_score = self._calculate_visual_scs(analysis_result)
             analysis_result['visual_scs_score'] = visual_scs_score
             
+            self._cache_put(cache_key, analysis_result)
             return analysis_result
             
         except Exception as e:
             # Return error result with empty analysis
-            return {
-                'error': str(e),
-                'visual_emotions': [],
-                'cultural_symbols': [],
-                'sensitivity_flags': [],
-                'text_overlay': '',
-                'brand_elements': [],
-                'festival_references': [],
-                'visual_emc_score': 0,
-                'visual_scs_score': 0
-            }
+            return self._analysis_error_result(str(e))
+    
+    def _analysis_error_result(self, error: str) -> Dict:
+        """Build an empty visual analysis result carrying an error message"""
+        return {
+            'error': error,
+            'visual_emotions': [],
+            'cultural_symbols': [],
+            'sensitivity_flags': [],
+            'text_overlay': '',
+            'brand_elements': [],
+            'festival_references': [],
+            'visual_emc_score': 0,
+            'visual_scs_score': 0
+        }
+    
+    def analyze_images_batch(self, images: List[str], max_workers: int = 4) -> List[Dict]:
+        """
+        Analyze several campaign images concurrently.
+        
+        Each image goes through analyze_image(), so cached images skip the
+        API and failures are reported per image.
+        
+        Args:
+            images: List of base64 encoded image strings
+            max_workers: Maximum number of concurrent Gemini requests, kept
+                low to stay within the API rate limit
+            
+        Returns:
+            List of visual analysis results in input order
+        """
+        if not images:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(images))) as executor:
+            return list(executor.map(self.analyze_image, images))
     
     def extract_text_from_image(self, image_data: str) -> Dict:
         """
@@ -193,30 +443,53 @@ Provide only the JSON response, no additional text."""
         try:
             # Parse base64 image data
             image_bytes = self._parse_image_data(image_data)
+        except Exception as e:
+            return self._ocr_error_result(str(e))
+        
+        return self._ocr_bytes(image_bytes)
+    
+    def _ocr_bytes(self, image_bytes: bytes) -> Dict:
+        """
+        Run OCR text extraction on already decoded image bytes.
+        
+        Args:
+            image_bytes: Raw image bytes
             
+        Returns:
+            Dictionary containing OCR results
+        """
+        cache_key = self._cache_key(image_bytes, 'ocr')
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
             # Create image part for Gemini
-            image_part = {
-                'mime_type': 'image/jpeg',
-                'data': image_bytes
-            }
+            image_part = self._image_part(image_bytes)
             
             # Generate content with image and OCR prompt
-            response = self.model.generate_content([self.ocr_prompt, image_part])
+            response = self._generate_content([self.ocr_prompt, image_part],
+                                              self.ocr_config)
             
             # Parse JSON response
             ocr_result = self._parse_ocr_response(response.text)
             
+            self._cache_put(cache_key, ocr_result)
             return ocr_result
             
         except Exception as e:
             # Return error result with empty extraction
-            return {
-                'error': str(e),
-                'extracted_text': '',
-                'text_elements': [],
-                'language': 'unknown',
-                'text_confidence': 'low'
-            }
+            return self._ocr_error_result(str(e))
+    
+    def _ocr_error_result(self, error: str) -> Dict:
+        """Build an empty OCR result carrying an error message"""
+        return {
+            'error': error,
+            'extracted_text': '',
+            'text_elements': [],
+            'language': 'unknown',
+            'text_confidence': 'low'
+        }
     
     def _parse_ocr_response(self, response_text: str) -> Dict:
         """
@@ -228,35 +501,13 @@ Provide only the JSON response, no additional text."""
         Returns:
             Parsed dictionary with OCR results
         """
+        # Try to extract JSON from response
+        response_text = self._extract_json_object(response_text)
+        
         try:
-            # Try to extract JSON from response
-            response_text = response_text.strip()
-            
-            # Remove markdown code block markers if present
-            if response_text.startswith('```json'):
-                response_text = response_text[7:]
-            elif response_text.startswith('```'):
-                response_text = response_text[3:]
-            
-            if response_text.endswith('```'):
-                response_text = response_text[:-3]
-            
-            response_text = response_text.strip()
-            
             # Parse JSON
-            result = json.loads(response_text)
-            
-            # Ensure all expected fields exist with defaults
-            default_result = {
-                'extracted_text': '',
-                'text_elements': [],
-                'language': 'unknown',
-                'text_confidence': 'medium'
-            }
-            
-            # Merge with defaults
-            default_result.update(result)
-            return default_result
+            result = _json_loads(response_text)
+            return self._with_ocr_defaults(result)
             
         except json.JSONDecodeError:
             # If JSON parsing fails, try to extract text directly
@@ -273,7 +524,10 @@ Provide only the JSON response, no additional text."""
         Perform both visual analysis and OCR text extraction on an image.
         
         This is a convenience method that combines analyze_image() and
-        extract_text_from_image() into a single call.
+        extract_text_from_image() into a single Gemini request. If the
+        combined response cannot be parsed, visual analysis is requested on
+        its own and OCR is only requested if the returned text_overlay is
+        too short to stand in for it.
         
         Args:
             image_data: Base64 encoded image string
@@ -283,14 +537,31 @@ Provide only the JSON response, no additional text."""
             
         Requirements: 15.2, 15.3
         """
-        # Perform visual analysis
-        analysis_result = self.analyze_image(image_data)
+        try:
+            # Parse base64 image data once for both requests
+            image_bytes = self._parse_image_data(image_data)
+        except Exception as e:
+            analysis_result = self._analysis_error_result(str(e))
+            analysis_result['ocr_result'] = self._ocr_error_result(str(e))
+            return analysis_result
         
-        # Perform OCR extraction
-        ocr_result = self.extract_text_from_image(image_data)
+        # One request covers both visual analysis and OCR
+        analysis_result = self._analyze_combined_bytes(image_bytes)
         
-        # Merge results
-        analysis_result['ocr_result'] = ocr_result
+        if analysis_result is None:
+            analysis_result = self._analyze_bytes(image_bytes)
+            text_overlay = analysis_result.get('text_overlay') or ''
+            
+            if len(text_overlay) >= self.min_overlay_text_length:
+                # Visual analysis already read the text; skip the OCR round-trip
+                ocr_result = self._with_ocr_defaults({'extracted_text': text_overlay})
+            else:
+                ocr_result = self._ocr_bytes(image_bytes)
+            
+            # Merge results
+            analysis_result['ocr_result'] = ocr_result
+        
+        ocr_result = analysis_result['ocr_result']
         
         # If text_overlay is empty but OCR found text, use OCR result
         if not analysis_result.get('text_overlay') and ocr_result.get('extracted_text'):
@@ -298,6 +569,397 @@ Provide only the JSON response, no additional text."""
         
         return analysis_result
     
+    def _analyze_combined_bytes(self, image_bytes: bytes) -> Optional[Dict]:
+        """
+        Run visual analysis and OCR on decoded image bytes with one request.
+        
+        Args:
+            image_bytes: Raw image bytes
+            
+        Returns:
+            Visual analysis results with an 'ocr_result' entry, or None if
+            the combined response could not be parsed
+        """
+        cache_key = self._cache_key(image_bytes, 'combined')
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            # Create image part for Gemini
+            image_part = self._image_part(image_bytes)
+            
+            # Generate content with image and combined prompt
+            response = self._generate_content([self.combined_prompt, image_part],
+                                              self.combined_config)
+            
+            # Parse JSON response
+            parsed = self._parse_combined_response(response.text)
+            if parsed is None:
+                return None
+            analysis_result, ocr_result = parsed
+            
+            # Calculate visual EMC and SCS scores
+            analysis_result['visual_emc_score'] = self._calculate_visual_emc(analysis_result)
+            analysis_result['visual_scs_score'] = self._calculate_visual_scs(analysis_result)
+            
+            analysis_result['ocr_result'] = ocr_result
+            self._cache_put(cache_key, analysis_result)
+            return analysis_result
+            
+        except Exception as e:
+            # Return error results with empty analysis and extraction
+            analysis_result = self._analysis_error_result(str(e))
+            analysis_result['ocr_result'] = self._ocr_error_result(str(e))
+            return analysis_result
+    
+    @staticmethod
+    def _json_generation_config(schema: Dict) -> genai.GenerationConfig:
+        """Build a generation config that makes Gemini emit JSON matching schema"""
+        return genai.GenerationConfig(
+            response_mime_type='application/json',
+            response_schema=schema
+        )
+    
+    def _generate_content(self, contents: List,
+                          generation_config: Optional[genai.GenerationConfig] = None):
+        """
+        Call Gemini generate_content, retrying transient failures with
+        exponential backoff and jitter. Authentication and request errors
+        are not retried.
+        
+        Args:
+            contents: Prompt and image parts for the request
+            generation_config: Optional config, e.g. a JSON response schema
+            
+        Returns:
+            Gemini response object
+            
+        Raises:
+            The last error once all attempts have failed
+        """
+        for attempt in range(1, MAX_API_ATTEMPTS + 1):
+            try:
+                return self.model.generate_content(
+                    contents, generation_config=generation_config
+                )
+            except TRANSIENT_API_ERRORS as e:
+                if attempt == MAX_API_ATTEMPTS:
+                    logger.error(f"Gemini request failed after {attempt} attempts: {str(e)}")
+                    raise
+                
+                delay = min(RETRY_BASE_DELAY * 2 ** (attempt - 1), RETRY_MAX_DELAY)
+                delay += random.uniform(0, delay / 2)
+                logger.warning(f"Gemini request failed ({str(e)}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+    
+    def _open_disk_cache(self):
+        """Open the on-disk result cache, or return None if it is unavailable"""
+        if diskcache is None:
+            return None
+        
+        try:
+            return diskcache.Cache(DISK_CACHE_DIR, size_limit=DISK_CACHE_SIZE_LIMIT)
+        except Exception as e:
+            logger.warning(f"Disk cache disabled, could not open {DISK_CACHE_DIR}: {str(e)}")
+            return None
+    
+    def _cache_key(self, image_bytes: bytes, kind: str) -> str:
+        """Build a result cache key from the image content, model and request kind"""
+        return (f"{hashlib.sha256(image_bytes).hexdigest()}:{PROMPT_VERSION}:"
+                f"{self.model_name}:{kind}")
+    
+    def _cache_get(self, cache_key: str) -> Optional[Dict]:
+        """
+        Look up a cached result.
+        
+        Returns:
+            A copy of the cached result, or None on a cache miss
+        """
+        with self._result_cache_lock:
+            result = self._result_cache.get(cache_key)
+            if result is not None:
+                self._result_cache.move_to_end(cache_key)
+        
+        if result is None:
+            if self._disk_cache is None:
+                return None
+            
+            # Fall back to results persisted by earlier runs
+            try:
+                result = self._disk_cache.get(cache_key)
+            except Exception as e:
+                logger.warning(f"Disk cache read failed: {str(e)}")
+                return None
+            if result is None:
+                return None
+            self._remember(cache_key, result)
+        
+        # Callers update results in place, so never hand out the cached copy
+        return copy.deepcopy(result)
+    
+    def _cache_put(self, cache_key: str, result: Dict):
+        """Cache a successful result, evicting the least recently used entry"""
+        # Failed or unparsable responses are worth retrying, so never cache them
+        if 'error' in result or 'parse_error' in result:
+            return
+        
+        self._remember(cache_key, copy.deepcopy(result))
+        
+        if self._disk_cache is not None:
+            # A failed write only loses the cached copy, never the result
+            try:
+                self._disk_cache.set(cache_key, result, expire=DISK_CACHE_EXPIRE)
+            except Exception as e:
+                logger.warning(f"Disk cache write failed: {str(e)}")
+    
+    def _remember(self, cache_key: str, result: Dict):
+        """Store a private copy of a result in the in-memory LRU cache"""
+        with self._result_cache_lock:
+            self._result_cache[cache_key] = result
+            self._result_cache.move_to_end(cache_key)
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """Clear all cached Gemini results, including the on-disk cache"""
+        with self._result_cache_lock:
+            self._result_cache.clear()
+        
+        if self._disk_cache is not None:
+            try:
+                self._disk_cache.clear()
+            except Exception as e:
+                logger.warning(f"Disk cache clear failed: {str(e)}")
+    
+    def cache_info(self) -> Dict:
+        """
+        Report result cache usage.
+        
+        Returns:
+            Dictionary with in-memory and on-disk cache statistics
+        """
+        with self._result_cache_lock:
+            memory_entries = len(self._result_cache)
+        
+        info = {
+            'memory_entries': memory_entries,
+            'memory_max_entries': RESULT_CACHE_SIZE,
+            'disk_enabled': self._disk_cache is not None
+        }
+        
+        if self._disk_cache is not None:
+            info['disk_directory'] = self._disk_cache.directory
+            info['disk_entries'] = len(self._disk_cache)
+            info['disk_size_bytes'] = self._disk_cache.volume()
+        
+        return info
+    
+    def _parse_combined_response(self, response_text: str) -> Optional[Tuple[Dict, Dict]]:
+        """
+        Parse a combined analysis + OCR Gemini response.
+        
+        Args:
+            response_text: Raw response text from Gemini
+            
+        Returns:
+            Tuple of (analysis dict, OCR dict) with defaults filled in, or
+            None if the response is not the expected JSON envelope
+        """
+        try:
+            result = _json_loads(self._extract_json_object(response_text))
+        except json.JSONDecodeError:
+            return None
+        
+        if not isinstance(result, dict) or not isinstance(result.get('analysis'), dict):
+            return None
+        
+        ocr_result = result.get('ocr_result')
+        if not isinstance(ocr_result, dict):
+            ocr_result = {}
+        
+        return (self._with_analysis_defaults(result['analysis']),
+                self._with_ocr_defaults(ocr_result))
+    
+    def _strip_code_fences(self, response_text: str) -> str:
+        """
+        Strip whitespace and markdown code block markers around a response.
+        
+        Args:
+            response_text: Raw response text from Gemini
+            
+        Returns:
+            Response text ready for JSON parsing
+        """
+        # Sometimes Gemini wraps JSON in markdown code blocks
+        response_text = response_text.strip()
+        
+        # Remove markdown code block markers if present
+        if response_text.startswith('```json'):
+            response_text = response_text[7:]  # Remove ```json
+        elif response_text.startswith('```'):
+            response_text = response_text[3:]  # Remove ```
+        
+        if response_text.endswith('```'):
+            response_text = response_text[:-3]  # Remove trailing ```
+        
+        return response_text.strip()
+    
+    def _extract_json_object(self, response_text: str) -> str:
+        """
+        Slice the first complete JSON object out of a response.
+        
+        Gemini sometimes adds prose such as "Here is the analysis:" before
+        or after the JSON, which a plain json.loads would reject.
+        
+        Args:
+            response_text: Raw response text from Gemini
+            
+        Returns:
+            The first balanced {...} object, or the code-fence-stripped
+            response if it contains none
+        """
+        response_text = self._strip_code_fences(response_text)
+        
+        # Fast path: the response is already just the object
+        if response_text.startswith('{') and response_text.endswith('}'):
+            return response_text
+        
+        start = response_text.find('{')
+        if start == -1:
+            return response_text
+        
+        depth = 0
+        in_string = False
+        escaped = False
+        for i in range(start, len(response_text)):
+            char = response_text[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == '\\':
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+                if depth == 0:
+                    return response_text[start:i + 1]
+        
+        # Unbalanced braces; let the JSON parser report the failure
+        return response_text
+    
+    def _with_analysis_defaults(self, result: Dict) -> Dict:
+        """Fill in any visual analysis fields missing from a parsed response"""
+        # Ensure all expected fields exist with defaults
+        default_result = {
+            'visual_emotions': [],
+            'cultural_symbols': [],
+            'sensitivity_flags': [],
+            'text_overlay': '',
+            'brand_elements': [],
+            'festival_references': [],
+            'skin_tone_representation': '',
+            'emotional_tone': '',
+            'visual_style': '',
+            'color_palette': [],
+            'composition': ''
+        }
+        
+        # Merge with defaults
+        default_result.update(result)
+        return default_result
+    
+    def _with_ocr_defaults(self, result: Dict) -> Dict:
+        """Fill in any OCR fields missing from a parsed response"""
+        # Ensure all expected fields exist with defaults
+        default_result = {
+            'extracted_text': '',
+            'text_elements': [],
+            'language': 'unknown',
+            'text_confidence': 'medium'
+        }
+        
+        # Merge with defaults
+        default_result.update(result)
+        return default_result
+    
+    def _image_part(self, image_bytes: bytes) -> Dict:
+        """Build a Gemini inline image part labelled with the detected MIME type"""
+        if self.optimize_images:
+            image_bytes = self._optimize_image(image_bytes)
+        
+        return {
+            'mime_type': self._detect_mime_type(image_bytes),
+            'data': image_bytes
+        }
+    
+    def _optimize_image(self, image_bytes: bytes) -> bytes:
+        """
+        Downscale images whose long edge exceeds MAX_IMAGE_EDGE.
+        
+        Smaller images, unreadable data, or a missing Pillow install leave
+        the bytes unchanged.
+        
+        Args:
+            image_bytes: Raw image bytes
+            
+        Returns:
+            Re-encoded image bytes, or the original bytes
+        """
+        if Image is None:
+            return image_bytes
+        
+        try:
+            with Image.open(io.BytesIO(image_bytes)) as image:
+                if max(image.size) <= MAX_IMAGE_EDGE:
+                    return image_bytes
+                
+                # Re-encoding drops the EXIF orientation tag, so apply it to the pixels
+                image = ImageOps.exif_transpose(image)
+                image.thumbnail((MAX_IMAGE_EDGE, MAX_IMAGE_EDGE), Image.LANCZOS)
+                
+                output = io.BytesIO()
+                if 'A' in image.mode or 'transparency' in image.info:
+                    # Keep transparency, which JPEG cannot store
+                    image.save(output, 'PNG', optimize=True)
+                else:
+                    image.convert('RGB').save(
+                        output, 'JPEG', quality=OPTIMIZED_JPEG_QUALITY, optimize=True
+                    )
+                return output.getvalue()
+        except Exception:
+            return image_bytes
+    
+    @staticmethod
+    def _detect_mime_type(image_bytes: bytes) -> str:
+        """
+        Detect image MIME type from its magic bytes.
+        
+        Args:
+            image_bytes: Raw image bytes
+            
+        Returns:
+            MIME type string, defaulting to image/jpeg when unrecognized
+        """
+        if image_bytes.startswith(b'\x89PNG'):
+            return 'image/png'
+        if image_bytes.startswith(b'\xff\xd8\xff'):
+            return 'image/jpeg'
+        if image_bytes[:4] == b'RIFF' and image_bytes[8:12] == b'WEBP':
+            return 'image/webp'
+        if image_bytes.startswith(b'GIF8'):
+            return 'image/gif'
+        if image_bytes[4:8] == b'ftyp' and image_bytes[8:12] in (b'heic', b'heix', b'mif1'):
+            return 'image/heic'
+        
+        # Assume JPEG, Gemini handles most formats
+        return 'image/jpeg'
+    
     def _parse_image_data(self, image_data: str) -> bytes:
         """
         Parse base64 image data, handling data URI prefix if present.
@@ -331,41 +993,11 @@ Provide only the JSON response, no additional text."""
         """
         try:
             # Try to extract JSON from response
-            # Sometimes Gemini wraps JSON in markdown code blocks
-            response_text = response_text.strip()
-            
-            # Remove markdown code block markers if present
-            if response_text.startswith('```json'):
-                response_text = response_text[7:]  # Remove ```json
-            elif response_text.startswith('```'):
-                response_text = response_text[3:]  # Remove ```
-            
-            if response_text.endswith('```'):
-                response_text = response_text[:-3]  # Remove trailing ```
-            
-            response_text = response_text.strip()
+            response_text = self._extract_json_object(response_text)
             
             # Parse JSON
-            result = json.loads(response_text)
-            
-            # Ensure all expected fields exist with defaults
-            default_result = {
-                'visual_emotions': [],
-                'cultural_symbols': [],
-                'sensitivity_flags': [],
-                'text_overlay': '',
-                'brand_elements': [],
-                'festival_references': [],
-                'skin_tone_representation': '',
-                'emotional_tone': '',
-                'visual_style': '',
-                'color_palette': [],
-                'composition': ''
-            }
-            
-            # Merge with defaults
-            default_result.update(result)
-            return default_result
+            result = _json_loads(response_text)
+            return self._with_analysis_defaults(result)
             
         except json.JSONDecodeError:
             # If JSON parsing fails, return empty result
@@ -410,11 +1042,11 @@ Provide only the JSON response, no additional text."""
         
         # Component 2: Emotional tone (0-30 points)
         emotional_tone = analysis.get('emotional_tone', '').lower()
-        if any(word in emotional_tone for word in ['strong', 'intense', 'powerful', 'vibrant']):
+        if self.STRONG_TONE_RE.search(emotional_tone):
             score += 30
-        elif any(word in emotional_tone for word in ['moderate', 'positive', 'warm']):
+        elif self.MODERATE_TONE_RE.search(emotional_tone):
             score += 20
-        elif any(word in emotional_tone for word in ['subtle', 'calm', 'gentle']):
+        elif self.SUBTLE_TONE_RE.search(emotional_tone):
             score += 10
         
         # Component 3: Cultural/moral framing (0-30 points)
@@ -448,38 +1080,28 @@ Provide only the JSON response, no additional text."""
         # Component 1: Sensitivity flags (major contributor)
         sensitivity_flags = analysis.get('sensitivity_flags', [])
         
-        for flag in sensitivity_flags:
-            flag_lower = flag.lower()
-            
-            # Critical sensitivity issues (40 points each)
-            if any(word in flag_lower for word in ['colorism', 'fair skin', 'skin whitening', 'religious conflict']):
-                score += 40
-            
-            # High sensitivity issues (30 points each)
-            elif any(word in flag_lower for word in ['religious', 'political', 'caste', 'communal']):
-                score += 30
-            
-            # Medium sensitivity issues (20 points each)
-            elif any(word in flag_lower for word in ['cultural appropriation', 'stereotype', 'insensitive']):
-                score += 20
-            
-            # Low sensitivity issues (10 points each)
-            else:
-                score += 10
+        for flag_lower in [flag.lower() for flag in sensitivity_flags]:
+            # Each flag scores its most severe tier: critical 40, high 30,
+            # medium 20, and 10 points if no tier keyword matches
+            flag_points = self.LOW_FLAG_POINTS
+            for match in self.FLAG_TIER_RE.finditer(flag_lower):
+                flag_points = max(flag_points, self.FLAG_TIER_POINTS[match.lastgroup])
+                if flag_points == self.FLAG_TIER_POINTS['critical']:
+                    break
+            score += flag_points
         
         # Component 2: Skin tone representation
         skin_tone = analysis.get('skin_tone_representation', '').lower()
-        if any(word in skin_tone for word in ['only fair', 'only light', 'lack of diversity', 'colorism']):
+        if self.EXCLUSIVE_SKIN_TONE_RE.search(skin_tone):
             score += 35
-        elif any(word in skin_tone for word in ['predominantly fair', 'mostly light']):
+        elif self.SKEWED_SKIN_TONE_RE.search(skin_tone):
             score += 20
         
         # Component 3: Controversial cultural symbols
         cultural_symbols = analysis.get('cultural_symbols', [])
-        controversial_symbols = ['beef', 'pork', 'alcohol', 'religious conflict']
         
         for symbol in cultural_symbols:
-            if any(word in symbol.lower() for word in controversial_symbols):
+            if self.CONTROVERSIAL_SYMBOL_RE.search(symbol.lower()):
                 score += 25
         
         return min(score, 100)
@@ -531,6 +1153,57 @@ Provide only the JSON response, no additional text."""
         }
 
 
+# API key genai is currently configured with (genai.configure is process-global)
+_configured_api_key: Optional[str] = None
+
+
+def _configure_api_key(api_key: str):
+    """Point the Gemini SDK at api_key, skipping the call if it already is"""
+    global _configured_api_key
+    
+    if api_key != _configured_api_key:
+        genai.configure(api_key=api_key)
+        _configured_api_key = api_key
+
+
+# Shared analyzer instances keyed by a digest of the API key, LRU order
+_global_analyzers: OrderedDict = OrderedDict()
+_global_analyzers_lock = threading.Lock()
+
+
+def get_image_analyzer(api_key: Optional[str] = None) -> ImageAnalyzer:
+    """
+    Get a shared image analyzer for an API key (one per key, for the
+    ANALYZER_CACHE_SIZE most recently used keys)
+    
+    Reusing the analyzer skips model construction and keeps its result cache
+    warm between calls. The Gemini SDK holds a single process-wide key, so
+    it is reconfigured whenever the requested key differs from the last one.
+    
+    Args:
+        api_key: Optional Gemini API key. If None, reads from GEMINI_API_KEY env variable.
+        
+    Returns:
+        ImageAnalyzer instance
+    """
+    resolved_key = api_key or os.getenv('GEMINI_API_KEY')
+    # Raw keys are not kept as dict keys; the analyzer holds its own
+    key_digest = hashlib.sha256(resolved_key.encode()).hexdigest() if resolved_key else None
+    
+    with _global_analyzers_lock:
+        analyzer = _global_analyzers.get(key_digest)
+        if analyzer is None:
+            analyzer = ImageAnalyzer(resolved_key)
+            _global_analyzers[key_digest] = analyzer
+            if len(_global_analyzers) > ANALYZER_CACHE_SIZE:
+                _global_analyzers.popitem(last=False)
+        else:
+            _global_analyzers.move_to_end(key_digest)
+            _configure_api_key(analyzer.api_key)
+    
+    return analyzer
+
+
 # Convenience function for quick image analysis
 def analyze_campaign_image(image_data: str, api_key: Optional[str] = None) -> Dict:
     """
@@ -543,5 +1216,4 @@ def analyze_campaign_image(image_data: str, api_key: Optional[str] = None) -> Di
     Returns:
         Dictionary containing visual analysis results
     """
-    analyzer = ImageAnalyzer(api_key)
-    return analyzer.analyze_image(image_data)
+    return get_image_analyzer(api_key).analyze_image(image_data)
@@ -0,0 +1,61 @@
+# AdsenseAI Campaign Risk Analyzer - Intent Kernels Module
+# Batched perceived-intent math behind PerceivedIntentCalculator, JIT-compiled with Numba when available
+
+from typing import Tuple
+
+import numpy as np
+
+from .outcome_kernels import _jit_parallel, prange, round_2dp
+
+
+@_jit_parallel
+def intent_batch_kernel(emc_score: np.ndarray, scs_score: np.ndarray, polarity: np.ndarray,
+                        subjectivity: np.ndarray, manipulation_penalty: np.ndarray) -> Tuple:
+    """
+    Perceived-intent math over arrays of items, one prange iteration each
+    (see PerceivedIntentCalculator.calculate_perceived_intent).
+    
+    Only worth calling with Numba available; without it this is a plain
+    Python loop.
+    
+    Returns:
+        Tuple of (authenticity, manipulation_risk, intent_score, intent_rounded)
+        float64 arrays; authenticity and manipulation_risk are rounded to 2
+        decimals like the scalar path, intent_score is unrounded (for banding)
+    """
+    n = emc_score.shape[0]
+    authenticity = np.empty(n)
+    manipulation = np.empty(n)
+    intent_score = np.empty(n)
+    intent_rounded = np.empty(n)
+    for i in prange(n):
+        emc = emc_score[i]
+        scs = scs_score[i]
+        
+        # Authenticity: positive sentiment (30%) + low SCS (40%) + appropriate EMC (30%)
+        positive_sentiment = ((polarity[i] + 1) / 2) * 100
+        if emc < 40:
+            # Too low - scale from 0 to 100
+            emc_appropriateness = (emc / 40) * 100
+        elif emc <= 70:
+            emc_appropriateness = 100.0  # Ideal range
+        else:
+            # Too high - scale from 100 down to 0
+            emc_appropriateness = max(0.0, 100 - ((emc - 70) / 30) * 100)
+        auth = positive_sentiment * 0.30 + (100 - scs) * 0.40 + emc_appropriateness * 0.30
+        auth = round_2dp(min(max(auth, 0.0), 100.0))
+        
+        # Manipulation: high SCS (40%) + excessive EMC above 70 (30%) + subjectivity (30%)
+        excessive_emc = 0.0
+        if emc > 70:
+            excessive_emc = ((emc - 70) / 30) * 100
+        manip = scs * 0.40 + excessive_emc * 0.30 + (subjectivity[i] * 100) * 0.30
+        manip = round_2dp(min(max(manip, 0.0), 100.0))
+        manip = min(manip + manipulation_penalty[i], 100.0)
+        
+        intent = min(max(auth - manip, -100.0), 100.0)
+        authenticity[i] = auth
+        manipulation[i] = manip
+        intent_score[i] = intent
+        intent_rounded[i] = round_2dp(intent)
+    return authenticity, manipulation, intent_score, intent_rounded
@@ -96,19 +96,23 @@ class MultiModalFusion:
             
         Requirements: 12.3
         """
+        # Deduplicate each modality (Gemini sometimes repeats tags)
+        text_set = set(text_emotions)
+        visual_set = set(visual_emotions)
+        
         # Create union of emotions (unique emotions from both)
-        combined_emotions = list(set(text_emotions + visual_emotions))
+        combined_emotions = text_set | visual_set
         
         # Track which emotions came from which modality
-        text_only = [e for e in text_emotions if e not in visual_emotions]
-        visual_only = [e for e in visual_emotions if e not in text_emotions]
-        both = [e for e in text_emotions if e in visual_emotions]
+        text_only = text_set - visual_set
+        visual_only = visual_set - text_set
+        both = text_set & visual_set
         
         return {
             'combined_emotions': sorted(combined_emotions),
             'emotion_count': len(combined_emotions),
-            'text_emotions': sorted(text_emotions),
-            'visual_emotions': sorted(visual_emotions),
+            'text_emotions': sorted(text_set),
+            'visual_emotions': sorted(visual_set),
             'text_only': sorted(text_only),
             'visual_only': sorted(visual_only),
             'both_modalities': sorted(both),
@@ -127,14 +131,17 @@ class MultiModalFusion:
         Returns:
             Dictionary with combined cultural symbols
         """
+        text_set = set(text_symbols)
+        visual_set = set(visual_symbols)
+        
         # Union of cultural symbols
-        combined_symbols = list(set(text_symbols + visual_symbols))
+        combined_symbols = text_set | visual_set
         
         return {
             'combined_symbols': sorted(combined_symbols),
             'symbol_count': len(combined_symbols),
-            'text_symbols': sorted(text_symbols),
-            'visual_symbols': sorted(visual_symbols)
+            'text_symbols': sorted(text_set),
+            'visual_symbols': sorted(visual_set)
         }
     
     def combine_sensitivity_flags(self, text_flags: List[str],
@@ -149,14 +156,17 @@ class MultiModalFusion:
         Returns:
             Dictionary with combined sensitivity flags
         """
+        text_set = set(text_flags)
+        visual_set = set(visual_flags)
+        
         # Union of sensitivity flags
-        combined_flags = list(set(text_flags + visual_flags))
+        combined_flags = text_set | visual_set
         
         return {
             'combined_flags': sorted(combined_flags),
             'flag_count': len(combined_flags),
-            'text_flags': sorted(text_flags),
-            'visual_flags': sorted(visual_flags)
+            'text_flags': sorted(text_set),
+            'visual_flags': sorted(visual_set)
         }
     
     def fuse_analyses(self, text_analysis: Dict, 
@@ -236,6 +246,10 @@ class MultiModalFusion:
         }
 
 
+# Fusion is stateless, so one module-level instance serves every call
+_global_fusion = MultiModalFusion()
+
+
 # Convenience function for quick multi-modal fusion
 def fuse_text_and_image_analysis(text_analysis: Dict,
                                  image_analysis: Optional[Dict] = None) -> Dict:
@@ -249,5 +263,4 @@ def fuse_text_and_image_analysis(text_analysis: Dict,
     Returns:
         Dictionary with fused multi-modal analysis
     """
-    fusion = MultiModalFusion()
-    return fusion.fuse_analyses(text_analysis, image_analysis)
+    return _global_fusion.fuse_analyses(text_analysis, image_analysis)
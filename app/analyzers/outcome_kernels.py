@@ -0,0 +1,317 @@
+# AdsenseAI Campaign Risk Analyzer - Outcome Kernels Module
+# Scalar scoring math behind OutcomePredictor, JIT-compiled with Numba when available
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # Kernels run as plain Python when Numba is not installed (it is in
+    # requirements.txt); batch scorers then take their slower NumPy paths
+    njit = None
+    prange = range
+
+NUMBA_AVAILABLE = njit is not None
+
+# Cultural risk multiplier by worst alert severity: none/medium/low, high, critical
+SEVERITY_MULTIPLIERS = (1.0, 1.3, 1.5)
+
+
+def _jit(func):
+    """Compile a kernel in nopython mode (cached on disk) if Numba is available"""
+    if njit is None:
+        return func
+    return njit(cache=True)(func)
+
+
+def _jit_parallel(func):
+    """Like _jit, but also run prange loops across all cores"""
+    if njit is None:
+        return func
+    return njit(cache=True, parallel=True)(func)
+
+
+@_jit
+def round_2dp(value: float) -> float:
+    """
+    Round to 2 decimals with exactly the same result as Python's round(value, 2).
+    
+    value * 100 is rounded to a double, so its rounding error is recovered
+    with a Veltkamp split to decide ties (half to even) on the exact product.
+    Small negative values round to -0.0, as with round().
+    """
+    scaled = value * 100.0
+    split = 134217729.0 * value  # 2**27 + 1
+    high = split - (split - value)
+    low = value - high
+    error = (high * 100.0 - scaled) + low * 100.0
+    whole = math.floor(scaled)
+    offset = (scaled - whole - 0.5) + error
+    if offset > 0 or (offset == 0 and whole % 2 != 0):
+        whole += 1.0
+    return math.copysign(whole / 100.0, value)
+
+
+def round_2dp_array(values: np.ndarray) -> np.ndarray:
+    """
+    Round an array to 2 decimals with the same results as round(x, 2).
+    
+    np.round scales by 100 before rounding, which can land on the other side
+    of a tie than Python's correctly rounded round(); the few values close
+    to a tie are rounded with round() instead.
+    """
+    rounded = np.round(values, 2)
+    scaled = values * 100
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        rounded[near_tie] = [round(value, 2) for value in values[near_tie].tolist()]
+    return rounded
+
+
+@_jit
+def virality_kernel(behavioral_intention: float, emotion_count: int, polarity: float,
+                    platform_multiplier: float) -> Tuple[float, float, int, int, int, int, bool]:
+    """
+    Virality score math (see OutcomePredictor.predict_virality).
+    
+    Returns:
+        Tuple of (virality_score, base_score, emotion_boost, polarity_boost,
+        positive_boost, negative_penalty, capped), where capped tells whether
+        the score was clamped to 0 or 100 (reported as an int, as before)
+    """
+    # Base score: behavioral intention (scaled to 70% to prevent always hitting 100)
+    base_score = behavioral_intention * 0.7
+    
+    # More emotions = more engaging = more likely to be shared
+    emotion_boost = min(emotion_count * 3, 15)
+    
+    # Strong sentiment (positive or negative) is more shareable
+    polarity_boost = 8 if abs(polarity) > 0.5 else 0
+    
+    # Positive content is more viral than negative
+    positive_boost = 0
+    if polarity > 0.3:
+        positive_boost = 8
+        if polarity > 0.6:
+            positive_boost = 12
+    
+    # Penalty for negative sentiment (negative content less viral)
+    negative_penalty = 0
+    if polarity < -0.3:
+        negative_penalty = 10
+        if polarity < -0.6:
+            negative_penalty = 18
+    
+    pre_multiplier_score = base_score + emotion_boost + polarity_boost + positive_boost - negative_penalty
+    virality_score = pre_multiplier_score * platform_multiplier
+    capped = virality_score > 100.0 or virality_score < 0.0
+    virality_score = max(min(virality_score, 100.0), 0.0)  # Cap between 0-100
+    
+    return (virality_score, base_score, emotion_boost, polarity_boost,
+            positive_boost, negative_penalty, capped)
+
+
+@_jit
+def backlash_kernel(perceived_intent: float, cultural_risk: float, critical_count: int,
+                    high_count: int, emc_score: float,
+                    polarity: float) -> Tuple[float, float, float, float, float, float, int, bool]:
+    """
+    Backlash risk math (see OutcomePredictor.predict_backlash).
+    
+    Returns:
+        Tuple of (backlash_risk, cultural_component, intent_component,
+        emc_component, sentiment_component, severity_multiplier, risk_factors,
+        capped), where capped tells whether the risk was clamped to 100
+    """
+    # Critical alerts outrank high ones: index 2 if any critical, else 1 if any high
+    severity_multiplier = SEVERITY_MULTIPLIERS[max(2 * int(critical_count > 0), int(high_count > 0))]
+    
+    cultural_risk = cultural_risk * severity_multiplier
+    # Normalize to 0-100 scale (assume max 150 with multiplier)
+    cultural_component = min((cultural_risk / 150.0) * 100, 100.0) * 0.30
+    
+    # Intent is the primary mediator: -100..+100 maps to a 100..20 contribution,
+    # +20 per threshold crossed (highly manipulative < -50 < moderately < -20
+    # < slightly < 0 < neutral < 20 <= authentic); summed comparisons keep it branch-free
+    # (int() each: uncompiled batch calls pass NumPy scalars, where bool_ + bool_ is OR)
+    intent_contribution = 20 + 20 * (int(perceived_intent < 20) + int(perceived_intent < 0)
+                                     + int(perceived_intent < -20) + int(perceived_intent < -50))
+    intent_component = intent_contribution * 0.40
+    
+    # High EMC can contribute to backlash if perceived as manipulative
+    # (zero, with nothing to compute, at or below 70)
+    emc_component = 0.0
+    if emc_score > 70:
+        emc_component = ((emc_score - 70) / 30) * 100 * 0.15  # 70-100 -> 0-100, 15%
+    
+    # Negative content is more likely to trigger backlash (zero when not negative)
+    sentiment_component = 0.0
+    if polarity < 0:
+        sentiment_component = -polarity * 100 * 0.15  # -1..0 -> 100..0, 15%
+    
+    backlash_risk = cultural_component + intent_component + emc_component + sentiment_component
+    
+    # Compound effect: when 3+ risk factors are present, multiply by 1.3
+    risk_factors = 0
+    if cultural_risk > 30:
+        risk_factors += 1
+    if perceived_intent < -20:
+        risk_factors += 1
+    if emc_score > 70:
+        risk_factors += 1
+    if polarity < -0.3:
+        risk_factors += 1
+    if critical_count > 0:
+        risk_factors += 1
+    
+    if risk_factors >= 3:
+        backlash_risk = backlash_risk * 1.3
+    capped = backlash_risk > 100.0
+    backlash_risk = min(backlash_risk, 100.0)  # Cap at 100
+    
+    return (backlash_risk, cultural_component, intent_component, emc_component,
+            sentiment_component, severity_multiplier, risk_factors, capped)
+
+
+@_jit
+def exposure_kernel(virality_score: float, backlash_risk: float) -> Tuple[float, float, float, bool]:
+    """
+    Exposure intensity math (see OutcomePredictor.calculate_exposure_intensity).
+    
+    Returns:
+        Tuple of (exposure_intensity, virality_component, backlash_component,
+        capped), where capped tells whether the intensity was clamped to 100
+    """
+    # Virality contributes 60% (primary driver of exposure)
+    # Backlash contributes 40% (controversial content also gets exposure)
+    virality_component = virality_score * 0.6
+    backlash_component = backlash_risk * 0.4
+    
+    exposure_intensity = virality_component + backlash_component
+    capped = exposure_intensity > 100.0
+    exposure_intensity = min(exposure_intensity, 100.0)  # Cap at 100
+    
+    return exposure_intensity, virality_component, backlash_component, capped
+
+
+@_jit
+def fatigue_kernel(exposure_intensity: float, word_count: int, hashtag_count: int,
+                   subjectivity: float) -> Tuple[float, int, int, int, float, bool]:
+    """
+    Ad-fatigue risk math (see OutcomePredictor.predict_ad_fatigue).
+    
+    Returns:
+        Tuple of (ad_fatigue_risk, length_penalty, hashtag_penalty,
+        subjectivity_penalty, exposure_factor, capped), where capped tells
+        whether the risk was clamped to 100
+    """
+    # Longer content = more fatigue
+    if word_count > 100:
+        length_penalty = 25
+    elif word_count > 50:
+        length_penalty = 15
+    else:
+        length_penalty = 0
+    
+    # Excessive hashtags: +2 per hashtag over 5
+    hashtag_penalty = 0
+    if hashtag_count > 5:
+        hashtag_penalty = (hashtag_count - 5) * 2
+    
+    # High subjectivity suggests salesy/opinion content
+    subjectivity_penalty = 20 if subjectivity > 0.7 else 0
+    
+    # Higher exposure = more repetition = more fatigue
+    exposure_factor = exposure_intensity * 0.3
+    
+    fatigue_risk = 30 + length_penalty + hashtag_penalty + subjectivity_penalty + exposure_factor
+    capped = fatigue_risk > 100.0
+    fatigue_risk = min(fatigue_risk, 100.0)  # Cap at 100
+    
+    return (fatigue_risk, length_penalty, hashtag_penalty, subjectivity_penalty,
+            exposure_factor, capped)
+
+
+
+@_jit
+def outcomes_kernel(behavioral_intention: float, emotion_count: int, polarity: float,
+                    subjectivity: float, platform_multiplier: float, perceived_intent: float,
+                    cultural_risk: float, critical_count: int, high_count: int,
+                    emc_score: float, word_count: int, hashtag_count: int):
+    """
+    Full virality -> backlash -> exposure -> ad-fatigue pipeline in one call
+    (see OutcomePredictor.predict_all_outcomes).
+    
+    Exposure is computed from the 2-decimal virality and backlash scores, and
+    ad-fatigue from the 2-decimal exposure, exactly as the per-outcome calls
+    chain them.
+    
+    Returns:
+        Tuple of (virality parts, backlash parts, exposure parts, fatigue parts,
+        (virality_score, backlash_risk, exposure_intensity, ad_fatigue_risk)
+        rounded to 2 decimals), where each parts tuple is the matching
+        kernel's result
+    """
+    virality = virality_kernel(behavioral_intention, emotion_count, polarity, platform_multiplier)
+    virality_score = round_2dp(virality[0])
+    
+    backlash = backlash_kernel(perceived_intent, cultural_risk, critical_count, high_count,
+                               emc_score, polarity)
+    backlash_risk = round_2dp(backlash[0])
+    
+    exposure = exposure_kernel(virality_score, backlash_risk)
+    exposure_intensity = round_2dp(exposure[0])
+    
+    fatigue = fatigue_kernel(exposure_intensity, word_count, hashtag_count, subjectivity)
+    ad_fatigue_risk = round_2dp(fatigue[0])
+    
+    return (virality, backlash, exposure, fatigue,
+            (virality_score, backlash_risk, exposure_intensity, ad_fatigue_risk))
+
+
+
+@_jit_parallel
+def outcomes_batch_kernel(behavioral_intention, emotion_count, polarity, subjectivity,
+                          platform_multiplier, perceived_intent, cultural_risk,
+                          critical_count, high_count, emc_score, word_count, hashtag_count):
+    """
+    Run outcomes_kernel over arrays of campaigns, one prange iteration each.
+    
+    Only worth calling with Numba available; without it this is a plain
+    Python loop.
+    
+    Returns:
+        Tuple of (scores, rounded) float64 arrays of shape (N, 4), columns
+        (virality, backlash, exposure, ad-fatigue); scores are unrounded
+        (for banding) and rounded holds the 2-decimal scores
+    """
+    n = behavioral_intention.shape[0]
+    scores = np.empty((n, 4))
+    rounded = np.empty((n, 4))
+    for i in prange(n):
+        virality, backlash, exposure, fatigue, rounded_scores = outcomes_kernel(
+            behavioral_intention[i], emotion_count[i], polarity[i], subjectivity[i],
+            platform_multiplier[i], perceived_intent[i], cultural_risk[i],
+            critical_count[i], high_count[i], emc_score[i], word_count[i], hashtag_count[i]
+        )
+        scores[i, 0] = virality[0]
+        scores[i, 1] = backlash[0]
+        scores[i, 2] = exposure[0]
+        scores[i, 3] = fatigue[0]
+        rounded[i, 0] = rounded_scores[0]
+        rounded[i, 1] = rounded_scores[1]
+        rounded[i, 2] = rounded_scores[2]
+        rounded[i, 3] = rounded_scores[3]
+    return scores, rounded
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from cache) at import so the first request does not pay for it
+    virality_kernel(50.0, 1, 0.0, 1.0)
+    backlash_kernel(0.0, 0.0, 0, 0, 0.0, 0.0)
+    exposure_kernel(50.0, 0.0)
+    fatigue_kernel(50.0, 1, 0, 0.0)
+    outcomes_kernel(50.0, 1, 0.0, 0.0, 1.0, 0.0, 0.0, 0, 0, 0.0, 1, 0)
@@ -1,7 +1,112 @@
 # AdsenseAI Campaign Risk Analyzer - Perceived Intent Calculator Module
 # Calculates audience attribution of creator motives (mediating variable in TPB)
 
-from typing import Dict, List
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .intent_kernels import intent_batch_kernel
+from .outcome_kernels import NUMBA_AVAILABLE, round_2dp_array
+
+try:
+    import ahocorasick
+except ImportError:
+    # Falls back to one substring scan per needle
+    ahocorasick = None
+
+
+# Number of texts whose manipulation-pattern scan is memoized per calculator
+MANIPULATION_SCAN_CACHE_SIZE = 4096
+
+# CRITICAL FIX 2: Manipulation pattern detection
+# Detects manipulative framing even with positive sentiment
+MANIPULATION_PATTERNS = {
+    'insecurity_exploitation': {
+        'triggers': ('dont let', 'stop letting', 'hold you back', 'holding you back',
+                     'problem', 'issue', 'struggle', 'suffering'),
+        'promises': ('transform', 'change', 'finally', 'guaranteed', 'secret',
+                     'solution', 'answer', 'fix', 'cure'),
+        'penalty': 40
+    },
+    'fear_based_selling': {
+        'triggers': ('miss out', 'left behind', 'before its too late', 'running out',
+                     'limited', 'last chance', 'dont wait', 'act now'),
+        'urgency': ('now', 'today', 'hurry', 'quick', 'fast', 'immediate'),
+        'penalty': 35
+    },
+    'shame_based_marketing': {
+        'triggers': ('embarrassed', 'ashamed', 'hide', 'ugly', 'unattractive',
+                     'disgusting', 'gross', 'inferior'),
+        'solutions': ('finally', 'no more', 'say goodbye', 'never again', 'transform'),
+        'penalty': 45
+    },
+    'false_causation': {
+        'claims': ('because of your', 'due to your', 'your X is why', 'reason you',
+                   'thats why you', 'if only you'),
+        'areas': ('job', 'career', 'marriage', 'success', 'failure', 'rejection',
+                  'relationship', 'money', 'wealth'),
+        'penalty': 50
+    }
+}
+
+# The two needle lists of each manipulation pattern that must both match
+REQUIRED_SLOTS = {
+    'insecurity_exploitation': ('triggers', 'promises'),
+    'fear_based_selling': ('triggers', 'urgency'),
+    'shame_based_marketing': ('triggers', 'solutions'),
+    'false_causation': ('claims', 'areas')
+}
+
+# Every needle across all patterns, matched against the text in one pass
+MANIPULATION_NEEDLES = frozenset(
+    needle
+    for pattern_name, slots in REQUIRED_SLOTS.items()
+    for slot in slots
+    for needle in MANIPULATION_PATTERNS[pattern_name][slot]
+)
+
+# Intent score thresholds (ascending) and the category/interpretation of each
+# band; a score's band is bisect_right(INTENT_THRESHOLDS, score)
+INTENT_THRESHOLDS = (-50, -20, 20, 50)
+INTENT_CATEGORIES = ('manipulative', 'manipulative', 'neutral', 'authentic', 'authentic')
+INTENT_INTERPRETATIONS = (
+    "Highly Manipulative - Likely perceived as insincere or exploitative",
+    "Moderately Manipulative - May be perceived as sales-focused",
+    "Neutral - Mixed signals, interpretation varies by audience",
+    "Moderately Authentic - Generally perceived as sincere",
+    "Highly Authentic - Likely perceived as genuine and values-aligned"
+)
+
+# Thresholds and labels used by the batch path; a value's band is
+# np.digitize(value, THRESHOLDS) (right=True for ambiguity, which uses
+# strict > comparisons)
+AMBIGUITY_THRESHOLDS = (30, 60)
+AMBIGUITY_FACTORS = ('low', 'medium', 'high')
+CONFIDENCE_THRESHOLDS = (30, 60)
+CONFIDENCE_LEVELS = ('high', 'medium', 'low')
+
+
+def _build_needle_automaton():
+    """Build the Aho-Corasick automaton over MANIPULATION_NEEDLES (None without pyahocorasick)"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for needle in MANIPULATION_NEEDLES:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+    return automaton
+
+
+# Built once at import and shared by all calculators (matching is read-only)
+_NEEDLE_AUTOMATON = _build_needle_automaton()
+
+
+def _clamp(value: float, low: float = 0, high: float = 100) -> float:
+    """Clamp value to [low, high] with two comparisons instead of min(max(...))"""
+    return low if value < low else (high if value > high else value)
 
 
 class PerceivedIntentCalculator:
@@ -13,37 +118,21 @@ class PerceivedIntentCalculator:
     
     def __init__(self):
         """Initialize the perceived intent calculator"""
-        
-        # CRITICAL FIX 2: Manipulation pattern detection
-        # Detects manipulative framing even with positive sentiment
-        self.MANIPULATION_PATTERNS = {
-            'insecurity_exploitation': {
-                'triggers': ['dont let', 'stop letting', 'hold you back', 'holding you back',
-                           'problem', 'issue', 'struggle', 'suffering'],
-                'promises': ['transform', 'change', 'finally', 'guaranteed', 'secret',
-                           'solution', 'answer', 'fix', 'cure'],
-                'penalty': 40
-            },
-            'fear_based_selling': {
-                'triggers': ['miss out', 'left behind', 'before its too late', 'running out',
-                           'limited', 'last chance', 'dont wait', 'act now'],
-                'urgency': ['now', 'today', 'hurry', 'quick', 'fast', 'immediate'],
-                'penalty': 35
-            },
-            'shame_based_marketing': {
-                'triggers': ['embarrassed', 'ashamed', 'hide', 'ugly', 'unattractive',
-                           'disgusting', 'gross', 'inferior'],
-                'solutions': ['finally', 'no more', 'say goodbye', 'never again', 'transform'],
-                'penalty': 45
-            },
-            'false_causation': {
-                'claims': ['because of your', 'due to your', 'your X is why', 'reason you',
-                          'thats why you', 'if only you'],
-                'areas': ['job', 'career', 'marriage', 'success', 'failure', 'rejection',
-                         'relationship', 'money', 'wealth'],
-                'penalty': 50
-            }
-        }
+        # Pattern tables and the needle automaton are built once at import
+        self.MANIPULATION_PATTERNS = MANIPULATION_PATTERNS
+        self._needles = MANIPULATION_NEEDLES
+        self._needle_automaton = _NEEDLE_AUTOMATON
+        
+        # _scan_text results keyed by lowercased text; the same caption is
+        # scanned again for every analysis stage and persona that uses it
+        self._scan_cache = OrderedDict()
+        self._scan_cache_lock = threading.Lock()
+    
+    def _find_needles(self, text_lower: str) -> FrozenSet[str]:
+        """Return the manipulation needles that occur (as substrings) in the text"""
+        if self._needle_automaton is not None:
+            return frozenset(needle for _, needle in self._needle_automaton.iter(text_lower))
+        return frozenset(needle for needle in self._needles if needle in text_lower)
     
     def calculate_authenticity_score(self, sentiment: Dict, scs_score: float, 
                                     emc_score: float) -> float:
@@ -89,12 +178,12 @@ class PerceivedIntentCalculator:
         
         # Calculate total authenticity score
         authenticity = sentiment_component + low_scs_component + emc_component
-        authenticity = min(max(authenticity, 0), 100)  # Clamp to 0-100
+        authenticity = _clamp(authenticity)  # Clamp to 0-100
         
         return round(authenticity, 2)
     
     def detect_manipulation_patterns(self, text: str, scs_score: float, 
-                                    sentiment: Dict) -> Dict:
+                                    sentiment: Dict, text_lower: Optional[str] = None) -> Dict:
         """
         CRITICAL FIX 2: Detect manipulation patterns even with positive sentiment.
         
@@ -105,6 +194,7 @@ class PerceivedIntentCalculator:
             text: Text content to analyze
             scs_score: Socio-cultural sensitivity score
             sentiment: Sentiment analysis dictionary
+            text_lower: Optional precomputed text.lower()
             
         Returns:
             Dictionary with manipulation detection results
@@ -116,58 +206,17 @@ class PerceivedIntentCalculator:
                 'total_penalty': 0
             }
         
-        text_lower = text.lower()
         patterns_found = []
         total_penalty = 0
-        
-        # Check each manipulation pattern
-        for pattern_name, pattern_def in self.MANIPULATION_PATTERNS.items():
-            pattern_detected = False
-            matched_elements = []
-            
-            if pattern_name == 'insecurity_exploitation':
-                # Check for triggers + promises combination
-                triggers = [t for t in pattern_def['triggers'] if t in text_lower]
-                promises = [p for p in pattern_def['promises'] if p in text_lower]
-                
-                if triggers and promises:
-                    pattern_detected = True
-                    matched_elements = triggers + promises
-                    
-            elif pattern_name == 'fear_based_selling':
-                # Check for triggers + urgency combination
-                triggers = [t for t in pattern_def['triggers'] if t in text_lower]
-                urgency = [u for u in pattern_def['urgency'] if u in text_lower]
-                
-                if triggers and urgency:
-                    pattern_detected = True
-                    matched_elements = triggers + urgency
-                    
-            elif pattern_name == 'shame_based_marketing':
-                # Check for triggers + solutions combination
-                triggers = [t for t in pattern_def['triggers'] if t in text_lower]
-                solutions = [s for s in pattern_def['solutions'] if s in text_lower]
-                
-                if triggers and solutions:
-                    pattern_detected = True
-                    matched_elements = triggers + solutions
-                    
-            elif pattern_name == 'false_causation':
-                # Check for claims + areas combination
-                claims = [c for c in pattern_def['claims'] if c in text_lower]
-                areas = [a for a in pattern_def['areas'] if a in text_lower]
-                
-                if claims and areas:
-                    pattern_detected = True
-                    matched_elements = claims + areas
-            
-            if pattern_detected:
-                patterns_found.append({
-                    'pattern': pattern_name,
-                    'penalty': pattern_def['penalty'],
-                    'matched': matched_elements[:5]  # Limit to 5 for brevity
-                })
-                total_penalty += pattern_def['penalty']
+        if text_lower is None:
+            text_lower = text.lower()
+        for pattern_name, penalty, matched in self._scan_text(text_lower):
+            patterns_found.append({
+                'pattern': pattern_name,
+                'penalty': penalty,
+                'matched': list(matched)
+            })
+            total_penalty += penalty
         
         # SPECIAL RULE: High SCS + Positive Sentiment = Likely Manipulation
         # Positive framing of harmful content is manipulative
@@ -186,6 +235,57 @@ class PerceivedIntentCalculator:
             'total_penalty': total_penalty
         }
     
+    def _scan_text(self, text_lower: str) -> Tuple[Tuple[str, int, Tuple[str, ...]], ...]:
+        """
+        Find the text-based manipulation patterns in lowercased text (memoized).
+        
+        Returns:
+            Tuple of (pattern name, penalty, matched needles) per detected pattern
+        """
+        with self._scan_cache_lock:
+            result = self._scan_cache.get(text_lower)
+            if result is not None:
+                self._scan_cache.move_to_end(text_lower)
+                return result
+        
+        found = self._find_needles(text_lower)
+        detected = []
+        
+        # Check each manipulation pattern: both of its required needle lists
+        # must have a match (e.g. triggers + promises for insecurity exploitation)
+        for pattern_name, pattern_def in self.MANIPULATION_PATTERNS.items():
+            required = REQUIRED_SLOTS.get(pattern_name)
+            if required is None or not found:
+                continue
+            
+            first_slot, second_slot = required
+            first = [needle for needle in pattern_def[first_slot] if needle in found]
+            if not first:
+                # Both lists must match, so the second one need not be checked
+                continue
+            second = [needle for needle in pattern_def[second_slot] if needle in found]
+            if not second:
+                continue
+            
+            matched_elements = first + second
+            detected.append((
+                pattern_name,
+                pattern_def['penalty'],
+                tuple(matched_elements[:5])  # Limit to 5 for brevity
+            ))
+        
+        result = tuple(detected)
+        with self._scan_cache_lock:
+            self._scan_cache[text_lower] = result
+            if len(self._scan_cache) > MANIPULATION_SCAN_CACHE_SIZE:
+                self._scan_cache.popitem(last=False)
+        return result
+    
+    def clear_cache(self):
+        """Clear all memoized manipulation-pattern scans"""
+        with self._scan_cache_lock:
+            self._scan_cache.clear()
+    
     def calculate_manipulation_risk(self, scs_score: float, emc_score: float,
                                    sentiment: Dict) -> float:
         """
@@ -226,12 +326,13 @@ class PerceivedIntentCalculator:
         
         # Calculate total manipulation risk
         manipulation = scs_component + emc_component + subjectivity_component
-        manipulation = min(max(manipulation, 0), 100)  # Clamp to 0-100
+        manipulation = _clamp(manipulation)  # Clamp to 0-100
         
         return round(manipulation, 2)
     
     def calculate_perceived_intent(self, emc_score: float, nam_score: float,
-                                  scs_score: float, sentiment: Dict, text: str = "") -> Dict:
+                                  scs_score: float, sentiment: Dict, text: str = "",
+                                  text_lower: Optional[str] = None) -> Dict:
         """
         Calculate perceived intent score representing audience attribution
         of creator motives.
@@ -245,6 +346,7 @@ class PerceivedIntentCalculator:
             scs_score: Socio-cultural sensitivity score (0-100)
             sentiment: Sentiment analysis dictionary
             text: Text content for manipulation detection (optional)
+            text_lower: Optional precomputed text.lower()
             
         Returns:
             Dictionary containing perceived intent analysis
@@ -256,7 +358,9 @@ class PerceivedIntentCalculator:
         manipulation = self.calculate_manipulation_risk(scs_score, emc_score, sentiment)
         
         # CRITICAL FIX 2: Detect manipulation patterns
-        manipulation_detection = self.detect_manipulation_patterns(text, scs_score, sentiment)
+        manipulation_detection = self.detect_manipulation_patterns(
+            text, scs_score, sentiment, text_lower
+        )
         
         # Apply manipulation penalty if patterns detected
         if manipulation_detection['manipulation_detected']:
@@ -266,24 +370,12 @@ class PerceivedIntentCalculator:
         # Calculate perceived intent score (-100 to +100)
         # Positive = authentic, Negative = manipulative
         intent_score = authenticity - manipulation
-        intent_score = max(min(intent_score, 100), -100)  # Clamp to -100 to +100
+        intent_score = _clamp(intent_score, -100, 100)  # Clamp to -100 to +100
         
         # Determine interpretation based on score
-        if intent_score >= 50:
-            interpretation = "Highly Authentic - Likely perceived as genuine and values-aligned"
-            category = "authentic"
-        elif intent_score >= 20:
-            interpretation = "Moderately Authentic - Generally perceived as sincere"
-            category = "authentic"
-        elif intent_score >= -20:
-            interpretation = "Neutral - Mixed signals, interpretation varies by audience"
-            category = "neutral"
-        elif intent_score >= -50:
-            interpretation = "Moderately Manipulative - May be perceived as sales-focused"
-            category = "manipulative"
-        else:
-            interpretation = "Highly Manipulative - Likely perceived as insincere or exploitative"
-            category = "manipulative"
+        band = bisect_right(INTENT_THRESHOLDS, intent_score)
+        interpretation = INTENT_INTERPRETATIONS[band]
+        category = INTENT_CATEGORIES[band]
         
         # Factor in narrative ambiguity
         # High ambiguity increases interpretive uncertainty
@@ -313,6 +405,84 @@ class PerceivedIntentCalculator:
             'manipulation_patterns': manipulation_detection  # NEW: Include pattern details
         }
     
+    def calculate_perceived_intent_batch(self, emc_score: Sequence[float],
+                                         nam_score: Sequence[float],
+                                         scs_score: Sequence[float],
+                                         polarity: Sequence[float],
+                                         subjectivity: Sequence[float],
+                                         manipulation_penalty: Optional[Sequence[float]] = None
+                                         ) -> Dict[str, np.ndarray]:
+        """
+        Calculate perceived intent for many pieces of content at once.
+        
+        Applies the calculate_perceived_intent formulas to one array per input,
+        in a parallel Numba kernel when available and with element-wise NumPy
+        operations otherwise. Text-based manipulation detection
+        stays per item: pass each detect_manipulation_patterns()['total_penalty']
+        as manipulation_penalty. Interpretation text is not built.
+        
+        Args:
+            emc_score: Emotional-moral content scores (0-100)
+            nam_score: Narrative ambiguity measure scores (0-100)
+            scs_score: Socio-cultural sensitivity scores (0-100)
+            polarity: Sentiment polarity per item (-1 to 1)
+            subjectivity: Sentiment subjectivity per item (0 to 1)
+            manipulation_penalty: Manipulation pattern penalty per item (default 0)
+            
+        Returns:
+            Dictionary of arrays: intent_score, authenticity, manipulation_risk,
+            category, ambiguity_factor and confidence
+        """
+        emc_score = np.asarray(emc_score, dtype=np.float64)
+        nam_score = np.asarray(nam_score, dtype=np.float64)
+        scs_score = np.asarray(scs_score, dtype=np.float64)
+        polarity = np.asarray(polarity, dtype=np.float64)
+        subjectivity = np.asarray(subjectivity, dtype=np.float64)
+        
+        if manipulation_penalty is None:
+            manipulation_penalty = np.zeros_like(emc_score)
+        else:
+            manipulation_penalty = np.asarray(manipulation_penalty, dtype=np.float64)
+        
+        if NUMBA_AVAILABLE:
+            authenticity, manipulation, intent_score, intent_rounded = intent_batch_kernel(
+                emc_score, scs_score, polarity, subjectivity, manipulation_penalty
+            )
+        else:
+            # Authenticity (see calculate_authenticity_score)
+            sentiment_component = ((polarity + 1) / 2) * 100 * 0.30
+            low_scs_component = (100 - scs_score) * 0.40
+            emc_appropriateness = np.where(
+                emc_score < 40,
+                (emc_score / 40) * 100,
+                np.where(emc_score > 70, np.maximum(0, 100 - ((emc_score - 70) / 30) * 100), 100)
+            )
+            authenticity = sentiment_component + low_scs_component + emc_appropriateness * 0.30
+            authenticity = round_2dp_array(np.clip(authenticity, 0, 100, out=authenticity))
+            
+            # Manipulation risk (see calculate_manipulation_risk)
+            excessive_emc = np.where(emc_score <= 70, 0, ((emc_score - 70) / 30) * 100)
+            manipulation = scs_score * 0.40 + excessive_emc * 0.30 + subjectivity * 100 * 0.30
+            manipulation = round_2dp_array(np.clip(manipulation, 0, 100, out=manipulation))
+            manipulation = np.minimum(manipulation + manipulation_penalty, 100)
+            
+            intent_score = authenticity - manipulation
+            np.clip(intent_score, -100, 100, out=intent_score)
+            intent_rounded = round_2dp_array(intent_score)
+        
+        uncertainty = nam_score * 0.6 + scs_score * 0.4
+        
+        return {
+            'intent_score': intent_rounded,
+            'authenticity': authenticity,
+            'manipulation_risk': manipulation,
+            'category': np.array(INTENT_CATEGORIES)[np.digitize(intent_score, INTENT_THRESHOLDS)],
+            'ambiguity_factor': np.array(AMBIGUITY_FACTORS)[
+                np.digitize(nam_score, AMBIGUITY_THRESHOLDS, right=True)
+            ],
+            'confidence': np.array(CONFIDENCE_LEVELS)[np.digitize(uncertainty, CONFIDENCE_THRESHOLDS)]
+        }
+    
     def _calculate_confidence(self, nam_score: float, scs_score: float) -> str:
         """
         Calculate confidence level in perceived intent assessment.
@@ -2,18 +2,25 @@
 Persona Library Manager
 
 Manages loading, caching, and retrieval of audience personas for testing.
-Implements singleton pattern for efficient persona data management.
+get_persona_library() shares one loaded library across the application.
 
 Requirements: 1.1-1.3
 """
 
 import json
 import os
-from typing import List, Optional, Dict
+import threading
+from typing import List, Optional, Dict, Tuple
 from pathlib import Path
 
 from app.models import Persona, PersonaCategory
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class PersonaLibrary:
     """
@@ -23,20 +30,13 @@ class PersonaLibrary:
     Provides methods to retrieve personas by ID, category, or all at once.
     """
     
-    _instance = None
-    _personas: Dict[str, Persona] = {}
-    _loaded = False
-    
-    def __new__(cls):
-        """Singleton pattern - only one instance of PersonaLibrary"""
-        if cls._instance is None:
-            cls._instance = super(PersonaLibrary, cls).__new__(cls)
-        return cls._instance
-    
     def __init__(self):
-        """Initialize the persona library (loads personas on first call)"""
-        if not self._loaded:
-            self.load_personas()
+        """Initialize the persona library and load the personas"""
+        self._personas: Dict[str, Persona] = {}
+        self._by_category: Dict[PersonaCategory, List[Persona]] = {}
+        self._sorted_categories: List[PersonaCategory] = []
+        self._search_index: List[Tuple[str, str, Persona]] = []
+        self.load_personas()
     
     def load_personas(self) -> None:
         """
@@ -47,9 +47,6 @@ class PersonaLibrary:
         
         Requirements: 1.1
         """
-        if self._loaded:
-            return
-        
         # Determine the path to the personas JSON file
         current_dir = Path(__file__).parent.parent
         personas_file = current_dir / "data" / "personas" / "mvp_personas.json"
@@ -60,9 +57,8 @@ class PersonaLibrary:
                 "Please ensure mvp_personas.json exists in app/data/personas/"
             )
         
-        # Load and parse the JSON file
-        with open(personas_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Load and parse the JSON file (parsed straight from the raw bytes)
+        data = _json_loads(personas_file.read_bytes())
         
         # Convert JSON data to Persona objects and cache them
         self._personas = {}
@@ -74,7 +70,18 @@ class PersonaLibrary:
                 print(f"Warning: Failed to load persona {persona_data.get('id', 'unknown')}: {e}")
                 continue
         
-        self._loaded = True
+        # Index personas by category (in library order) for category lookups
+        self._by_category = {}
+        for persona in self._personas.values():
+            self._by_category.setdefault(persona.category, []).append(persona)
+        self._sorted_categories = sorted(self._by_category, key=lambda x: x.value)
+        
+        # Lowercased (name, tagline) per persona so searches don't re-lowercase them
+        self._search_index = [
+            (persona.name.lower(), persona.tagline.lower(), persona)
+            for persona in self._personas.values()
+        ]
+        
         print(f"Loaded {len(self._personas)} personas into library")
     
     def get_persona_by_id(self, persona_id: str) -> Optional[Persona]:
@@ -112,10 +119,7 @@ class PersonaLibrary:
         Returns:
             List of Persona objects matching the category
         """
-        return [
-            persona for persona in self._personas.values()
-            if persona.category == category
-        ]
+        return list(self._by_category.get(category, ()))
     
     def get_personas_by_ids(self, persona_ids: List[str]) -> List[Persona]:
         """
@@ -127,12 +131,10 @@ class PersonaLibrary:
         Returns:
             List of Persona objects (skips IDs that don't exist)
         """
-        personas = []
-        for persona_id in persona_ids:
-            persona = self.get_persona_by_id(persona_id)
-            if persona:
-                personas.append(persona)
-        return personas
+        return [
+            persona for persona in map(self._personas.get, persona_ids)
+            if persona is not None
+        ]
     
     def get_persona_count(self) -> int:
         """Get the total number of loaded personas"""
@@ -140,8 +142,7 @@ class PersonaLibrary:
     
     def get_all_categories(self) -> List[PersonaCategory]:
         """Get list of all unique categories in the library"""
-        categories = set(persona.category for persona in self._personas.values())
-        return sorted(list(categories), key=lambda x: x.value)
+        return list(self._sorted_categories)
     
     def search_personas(self, query: str) -> List[Persona]:
         """
@@ -155,24 +156,31 @@ class PersonaLibrary:
         """
         query_lower = query.lower()
         return [
-            persona for persona in self._personas.values()
-            if query_lower in persona.name.lower() or query_lower in persona.tagline.lower()
+            persona for name_lower, tagline_lower, persona in self._search_index
+            if query_lower in name_lower or query_lower in tagline_lower
         ]
 
 
-# Singleton instance getter
-_library_instance = None
+# Global instance
+_library_instance: Optional[PersonaLibrary] = None
+_library_instance_lock = threading.Lock()
+
 
 def get_persona_library() -> PersonaLibrary:
     """
     Get the singleton PersonaLibrary instance.
     
-    This is the recommended way to access the persona library.
+    This is the recommended way to access the persona library; the
+    personas file is read once, by whichever caller gets here first.
     
     Returns:
         PersonaLibrary singleton instance
     """
     global _library_instance
+    
     if _library_instance is None:
-        _library_instance = PersonaLibrary()
+        with _library_instance_lock:
+            if _library_instance is None:
+                _library_instance = PersonaLibrary()
+    
     return _library_instance
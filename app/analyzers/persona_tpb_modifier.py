@@ -2,8 +2,432 @@
 # Modifies Theory of Planned Behaviour (TPB) scores based on persona characteristics
 # Requirements: 12.1-12.3
 
-from typing import Dict, List
-from app.models import Persona
+import os
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, FrozenSet, List, NamedTuple, Sequence, Tuple, Union
+
+import numpy as np
+
+from app.models import AdReceptivity, EngagementStyle, Persona, SharingPropensity
+from .outcome_kernels import NUMBA_AVAILABLE, round_2dp_array
+from .tpb_kernels import tpb_batch_kernel
+
+
+# Number of personas whose derived features are memoized per modifier
+PERSONA_FEATURES_CACHE_SIZE = 256
+
+# Number of (persona, base scores, content) results memoized per modifier
+TPB_RESULT_CACHE_SIZE = 4096
+
+# (persona values, content values) pairs that pull in opposite directions
+VALUE_CONFLICTS = (
+    (frozenset({'tradition', 'family'}), frozenset({'freedom', 'independence'})),
+    (frozenset({'success', 'achievement'}), frozenset({'community', 'collective'})),
+    (frozenset({'innovation', 'change'}), frozenset({'stability', 'tradition'}))
+)
+
+# Norms modifier by SharingPropensity code (never, selective, frequent, viral, other)
+SHARING_MODIFIERS = (-0.2, -0.05, 0.1, 0.2, 0)
+
+# Control modifier by EngagementStyle code (passive, reactive, proactive, creator, other)
+ENGAGEMENT_MODIFIERS = (-0.15, -0.05, 0.1, 0.15, 0)
+
+# Control modifier by AdReceptivity code (ad_blocker, tolerant, receptive, engaged, other)
+RECEPTIVITY_MODIFIERS = (-0.15, -0.05, 0.05, 0.1, 0)
+
+# Record of one (persona, content) pair in a modify_tpb_batch result
+TPB_BATCH_DTYPE = np.dtype([
+    ('attitude', np.float64),
+    ('subjective_norms', np.float64),
+    ('perceived_control', np.float64),
+    ('behavioral_intention', np.float64),
+    ('attitude_modifier', np.float64),
+    ('norms_modifier', np.float64),
+    ('control_modifier', np.float64),
+    ('modification_flags', np.uint8)
+])
+
+# modification_flags bits: which modifiers move their score by more than 5%
+MODIFIED_ATTITUDE = 1
+MODIFIED_NORMS = 2
+MODIFIED_CONTROL = 4
+
+# Engagement styles for which complex content reduces perceived control
+LOW_ENGAGEMENT_STYLES = (EngagementStyle.PASSIVE, EngagementStyle.REACTIVE)
+
+# Bit position of every value/interest/trigger token seen on a persona (and of the
+# VALUE_CONFLICTS tokens); content tokens without a bit cannot overlap any persona
+TOKEN_BITS: Dict[str, int] = {}
+_token_bits_lock = threading.Lock()
+
+
+def _persona_mask(tokens) -> int:
+    """Bitmask of persona tokens, assigning bits to tokens not seen before"""
+    mask = 0
+    with _token_bits_lock:
+        for token in tokens:
+            bit = TOKEN_BITS.get(token)
+            if bit is None:
+                bit = TOKEN_BITS[token] = len(TOKEN_BITS)
+            mask |= 1 << bit
+    return mask
+
+
+def _content_mask(tokens) -> int:
+    """Bitmask of the content tokens that have a bit"""
+    mask = 0
+    for token in tokens:
+        bit = TOKEN_BITS.get(token)
+        if bit is not None:
+            mask |= 1 << bit
+    return mask
+
+
+def _popcount(mask: int) -> int:
+    """Number of set bits (int.bit_count needs Python 3.10)"""
+    return bin(mask).count('1')
+
+
+# VALUE_CONFLICTS as (persona mask, content mask) pairs
+VALUE_CONFLICT_MASKS = tuple(
+    (_persona_mask(persona_set), _persona_mask(content_set))
+    for persona_set, content_set in VALUE_CONFLICTS
+)
+
+# The same masks as uint64 arrays for the batch path; VALUE_CONFLICTS tokens are
+# registered first, so their bits (CONFLICT_TOKENS_MASK) are the lowest ones
+CONFLICT_PERSONA_MASKS = np.array([masks[0] for masks in VALUE_CONFLICT_MASKS], dtype=np.uint64)
+CONFLICT_CONTENT_MASKS = np.array([masks[1] for masks in VALUE_CONFLICT_MASKS], dtype=np.uint64)
+CONFLICT_TOKENS_MASK = (1 << len(TOKEN_BITS)) - 1
+
+
+class ContentAnalysis(NamedTuple):
+    """
+    Content fields read by the persona modifiers, as attributes.
+    
+    modify_tpb_for_persona and modify_tpb_batch also accept content analysis
+    dicts, which they convert with from_dict; pass ContentAnalysis objects to
+    skip the conversion when scoring the same content repeatedly. platform is
+    the lowercase platform name (from_dict lowercases and interns it once);
+    from_dict stores list fields as tuples, so the result is hashable.
+    """
+    is_creative: bool = False
+    is_novel: bool = False
+    is_detailed: bool = False
+    has_facts: bool = False
+    is_social: bool = False
+    is_energetic: bool = False
+    is_aspirational: bool = False
+    is_premium: bool = False
+    is_complex: bool = False
+    platform: str = 'instagram'
+    topics: Sequence[str] = ()
+    themes: Sequence[str] = ()
+    detected_values: Sequence[str] = ()
+    
+    @classmethod
+    def from_dict(cls, content_analysis: Dict) -> 'ContentAnalysis':
+        """Pick the modifier fields out of a content analysis dict"""
+        get = content_analysis.get
+        return cls(
+            is_creative=bool(get('is_creative', False)),
+            is_novel=bool(get('is_novel', False)),
+            is_detailed=bool(get('is_detailed', False)),
+            has_facts=bool(get('has_facts', False)),
+            is_social=bool(get('is_social', False)),
+            is_energetic=bool(get('is_energetic', False)),
+            is_aspirational=bool(get('is_aspirational', False)),
+            is_premium=bool(get('is_premium', False)),
+            is_complex=bool(get('is_complex', False)),
+            platform=sys.intern(get('platform', 'instagram').lower()),
+            topics=_freeze(get('topics', ())),
+            themes=_freeze(get('themes', ())),
+            detected_values=_freeze(get('detected_values', ()))
+        )
+
+
+def _freeze(values):
+    """Lists as tuples (other values unchanged)"""
+    return tuple(values) if isinstance(values, list) else values
+
+
+def _as_content(content_analysis: Union[Dict, ContentAnalysis]) -> ContentAnalysis:
+    """Convert a content analysis dict to a ContentAnalysis (passing one through)"""
+    if isinstance(content_analysis, ContentAnalysis):
+        return content_analysis
+    return ContentAnalysis.from_dict(content_analysis)
+
+
+class PersonaFeatures(NamedTuple):
+    """
+    Persona-derived inputs of the modifier calculations, computed once per persona.
+    
+    The value/interest/ignore-trigger lists are kept as frozensets (for the
+    batch path) and as token bitmasks, so that overlaps with a content list
+    are one AND and a popcount.
+    """
+    core_values: FrozenSet[str]
+    core_values_mask: int
+    core_value_count: int  # len(core_values list), at least 1
+    interests: FrozenSet[str]
+    interests_mask: int
+    interest_count: int  # len(interests list), at least 1
+    ignore_triggers: FrozenSet[str]
+    ignore_mask: int
+    openness_factor: float
+    conscientiousness_factor: float
+    extraversion_factor: float
+    collectivism_score: float
+    family_orientation: float
+    status_factor: float
+    sharing_code: SharingPropensity
+    engagement_code: EngagementStyle
+    receptivity_code: AdReceptivity
+    
+    @classmethod
+    def from_persona(cls, persona: Persona) -> 'PersonaFeatures':
+        """Derive the modifier inputs from a persona"""
+        psychographics = persona.psychographics
+        cultural_profile = persona.cultural_profile
+        media_behavior = persona.media_behavior
+        return cls(
+            core_values=frozenset(psychographics.core_values),
+            core_values_mask=_persona_mask(psychographics.core_values),
+            core_value_count=max(len(psychographics.core_values), 1),
+            interests=frozenset(psychographics.interests),
+            interests_mask=_persona_mask(psychographics.interests),
+            interest_count=max(len(psychographics.interests), 1),
+            ignore_triggers=frozenset(persona.behavioral_triggers.ignore_triggers),
+            ignore_mask=_persona_mask(persona.behavioral_triggers.ignore_triggers),
+            openness_factor=(psychographics.openness - 50) / 100,
+            conscientiousness_factor=(psychographics.conscientiousness - 50) / 100,
+            extraversion_factor=(psychographics.extraversion - 50) / 100,
+            collectivism_score=100 - cultural_profile.individualism,
+            family_orientation=cultural_profile.family_orientation,
+            status_factor=(cultural_profile.status_consciousness - 50) / 100,
+            sharing_code=SharingPropensity.from_label(media_behavior.sharing_propensity),
+            engagement_code=EngagementStyle.from_label(media_behavior.engagement_style),
+            receptivity_code=AdReceptivity.from_label(media_behavior.ad_receptivity)
+        )
+
+
+class PersonaTable(NamedTuple):
+    """
+    Modifier inputs of a batch of N personas, one column per attribute.
+    
+    Numeric attributes are (N,) arrays (float64, so batch scores match the
+    scalar path exactly; codes are int8), platform affinities an (N, P) array
+    over platforms. The value/interest/ignore-trigger sets stay per persona,
+    for the overlap counts. Build once with from_personas and pass to
+    PersonaTPBModifier.modify_tpb_batch to score many content batches
+    against the same personas.
+    """
+    core_values: Tuple[FrozenSet[str], ...]
+    core_value_count: np.ndarray
+    interests: Tuple[FrozenSet[str], ...]
+    interest_count: np.ndarray
+    ignore_triggers: Tuple[FrozenSet[str], ...]
+    openness_factor: np.ndarray
+    conscientiousness_factor: np.ndarray
+    extraversion_factor: np.ndarray
+    collectivism_score: np.ndarray
+    family_orientation: np.ndarray
+    status_factor: np.ndarray
+    sharing_code: np.ndarray
+    engagement_code: np.ndarray
+    receptivity_code: np.ndarray
+    platforms: Tuple[str, ...]
+    platform_affinity: np.ndarray
+    
+    @classmethod
+    def from_personas(cls, personas: Sequence[Persona],
+                      features: Sequence[PersonaFeatures] = None) -> 'PersonaTable':
+        """
+        Pack personas into columns.
+        
+        Args:
+            personas: Personas to pack (N)
+            features: Their PersonaFeatures, if already derived
+        """
+        if features is None:
+            features = [PersonaFeatures.from_persona(persona) for persona in personas]
+        affinities = [persona.media_behavior.platform_affinity for persona in personas]
+        platforms = tuple(dict.fromkeys(
+            platform for affinity in affinities for platform in affinity
+        ))
+        
+        def column(name, dtype=np.float64):
+            return np.array([getattr(f, name) for f in features], dtype=dtype)
+        
+        return cls(
+            core_values=tuple(f.core_values for f in features),
+            core_value_count=column('core_value_count'),
+            interests=tuple(f.interests for f in features),
+            interest_count=column('interest_count'),
+            ignore_triggers=tuple(f.ignore_triggers for f in features),
+            openness_factor=column('openness_factor'),
+            conscientiousness_factor=column('conscientiousness_factor'),
+            extraversion_factor=column('extraversion_factor'),
+            collectivism_score=column('collectivism_score'),
+            family_orientation=column('family_orientation'),
+            status_factor=column('status_factor'),
+            sharing_code=column('sharing_code', np.int8),
+            engagement_code=column('engagement_code', np.int8),
+            receptivity_code=column('receptivity_code', np.int8),
+            platforms=platforms,
+            platform_affinity=np.array(
+                [[affinity.get(platform, 0.5) for platform in platforms] for affinity in affinities],
+                dtype=np.float64
+            ).reshape(len(affinities), len(platforms))
+        )
+    
+    def take_rows(self, rows: slice) -> 'PersonaTable':
+        """Table of the personas in a slice of the rows"""
+        return self._replace(**{
+            name: getattr(self, name)[rows] for name in self._fields if name != 'platforms'
+        })
+
+
+def _specialize_modifiers(features: PersonaFeatures,
+                          platform_affinity: Dict[str, float]
+                          ) -> Callable[[ContentAnalysis], Tuple[float, float, float]]:
+    """
+    Build the fused modifier calculation of one persona.
+    
+    Persona-only terms are folded into closure constants and branches that
+    cannot apply to the persona are dropped, so scoring many content items
+    against the persona only does the content-dependent work.
+    
+    Returns:
+        Function of a ContentAnalysis returning (attitude_modifier,
+        norms_modifier, control_modifier), as PersonaTPBModifier._calculate_all_modifiers
+    """
+    values_mask = features.core_values_mask
+    value_count = features.core_value_count
+    # Content values conflicting with the persona's values (any one applies the penalty once)
+    conflict_mask = 0
+    for persona_conflict, content_conflict in VALUE_CONFLICT_MASKS:
+        if values_mask & persona_conflict:
+            conflict_mask |= content_conflict
+    openness_term = features.openness_factor * 0.15
+    conscientiousness_term = features.conscientiousness_factor * 0.1
+    extraversion_term = features.extraversion_factor * 0.1
+    interests_mask = features.interests_mask
+    interest_count = features.interest_count
+    ignore_mask = features.ignore_mask
+    
+    # Norms 1. Cultural Collectivism Modifier (-0.2 to +0.2)
+    # Low individualism (high collectivism) = stronger social norms
+    if features.collectivism_score > 60:
+        # Collectivist personas feel stronger social pressure
+        norms_start = 0.2
+    elif features.collectivism_score < 40:
+        # Individualist personas feel less social pressure
+        norms_start = -0.15
+    else:
+        norms_start = 0.0
+    family_oriented = features.family_orientation > 70
+    status_term = features.status_factor * 0.15
+    sharing_term = SHARING_MODIFIERS[features.sharing_code]
+    get_affinity = platform_affinity.get
+    
+    # Control 1. Engagement Style Modifier (-0.15 to +0.15)
+    # Active engagers feel more control over their actions
+    # Control 2. Ad Receptivity Modifier (-0.15 to +0.1)
+    # Ad-averse personas feel less control (defensive)
+    # Ad-receptive personas feel more control (comfortable)
+    control_start = (0.0 + ENGAGEMENT_MODIFIERS[features.engagement_code]
+                     + RECEPTIVITY_MODIFIERS[features.receptivity_code])
+    low_engagement = features.engagement_code in LOW_ENGAGEMENT_STYLES
+    
+    def modifiers(content: ContentAnalysis) -> Tuple[float, float, float]:
+        attitude = 0.0
+        
+        # Attitude 1. Value Alignment Modifier (-0.2 to +0.2)
+        # Check if content values align with persona values
+        if values_mask:
+            content_values = content.detected_values
+            if content_values:
+                # Calculate overlap
+                content_mask = _content_mask(content_values)
+                matching_values = _popcount(values_mask & content_mask)
+                if matching_values:
+                    # Positive modifier for value alignment
+                    attitude += matching_values / value_count * 0.2
+                elif content_mask & conflict_mask:
+                    # Value conflict
+                    attitude -= 0.15
+        
+        # Attitude 2. Personality (OCEAN) Modifier (-0.15 to +0.15)
+        # High openness: More receptive to creative/novel content
+        if content.is_creative or content.is_novel:
+            attitude += openness_term
+        
+        # High conscientiousness: Prefer factual/detailed content
+        if content.is_detailed or content.has_facts:
+            attitude += conscientiousness_term
+        
+        # High extraversion: Respond to social/energetic content
+        if content.is_social or content.is_energetic:
+            attitude += extraversion_term
+        
+        # Attitude 3. Interest Relevance Modifier (-0.15 to +0.15)
+        if interests_mask:
+            content_topics = content.topics
+            if content_topics:
+                topics_mask = _content_mask(content_topics)
+                matching_interests = _popcount(interests_mask & topics_mask)
+                if matching_interests:
+                    attitude += matching_interests / interest_count * 0.15
+                elif ignore_mask & topics_mask:
+                    # Content matches ignore triggers
+                    attitude -= 0.15
+        
+        norms = norms_start
+        
+        # Norms 2. Family Orientation Modifier (0 to +0.15)
+        # High family orientation increases social pressure for family-related content
+        if family_oriented:
+            content_themes = content.themes
+            if 'family' in content_themes or 'relationships' in content_themes:
+                norms += 0.15
+        
+        # Norms 3. Status Consciousness Modifier (-0.15 to +0.15)
+        # High status consciousness increases social pressure for aspirational content
+        if content.is_aspirational or content.is_premium:
+            norms += status_term
+        
+        # Norms 4. Sharing Propensity Modifier (-0.2 to +0.2)
+        norms += sharing_term
+        
+        # Norms 5. Platform Affinity Modifier (-0.15 to +0.15)
+        affinity = get_affinity(content.platform, 0.5)
+        # Convert 0-1 affinity to -0.15 to +0.15 modifier
+        norms += (affinity - 0.5) * 0.3
+        
+        control = control_start
+        
+        # Control 3. Platform Familiarity Modifier (0 to +0.1)
+        # High platform affinity = more comfortable = more control
+        if affinity > 0.7:
+            control += 0.1
+        elif affinity < 0.3:
+            control -= 0.1
+        
+        # Control 4. Content Complexity Modifier (-0.1 to 0)
+        # Complex content reduces perceived control for less engaged personas
+        if low_engagement and content.is_complex:
+            control -= 0.1
+        
+        # Clamp modifiers to -0.5 to +0.5 (attitude, norms) and -0.3 to +0.3 (control)
+        return (max(min(attitude, 0.5), -0.5), max(min(norms, 0.5), -0.5),
+                max(min(control, 0.3), -0.3))
+    
+    return modifiers
 
 
 class PersonaTPBModifier:
@@ -23,13 +447,57 @@ class PersonaTPBModifier:
     
     def __init__(self):
         """Initialize the PersonaTPBModifier"""
-        pass
+        # id(persona) -> (weak reference to the persona, PersonaFeatures, specialized
+        # modifier function), LRU order; the reference guards against a recycled
+        # id of a collected persona
+        self._features_cache = OrderedDict()
+        self._features_cache_lock = threading.Lock()
+        # (id(persona), base attitude/norms/control, ContentAnalysis) ->
+        # (weak reference to the persona, result dict), LRU order
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+    
+    def _persona_entry(self, persona: Persona) -> Tuple[PersonaFeatures, Callable]:
+        """
+        Get the derived features and specialized modifier function of a persona
+        (memoized by identity).
+        
+        Personas are treated as immutable once loaded; call clear_cache after
+        modifying one in place.
+        """
+        key = id(persona)
+        with self._features_cache_lock:
+            entry = self._features_cache.get(key)
+            if entry is not None and entry[0]() is persona:
+                self._features_cache.move_to_end(key)
+                return entry[1], entry[2]
+        
+        features = PersonaFeatures.from_persona(persona)
+        modifiers = _specialize_modifiers(features, persona.media_behavior.platform_affinity)
+        with self._features_cache_lock:
+            self._features_cache[key] = (weakref.ref(persona), features, modifiers)
+            self._features_cache.move_to_end(key)
+            if len(self._features_cache) > PERSONA_FEATURES_CACHE_SIZE:
+                self._features_cache.popitem(last=False)
+        return features, modifiers
+    
+    def _features(self, persona: Persona) -> PersonaFeatures:
+        """Get the derived features of a persona (memoized by identity)"""
+        return self._persona_entry(persona)[0]
+    
+    def clear_cache(self):
+        """Clear the memoized persona features, modifier functions and results"""
+        with self._features_cache_lock:
+            self._features_cache.clear()
+        with self._result_cache_lock:
+            self._result_cache.clear()
     
     def modify_tpb_for_persona(
         self,
         base_tpb: Dict,
         persona: Persona,
-        content_analysis: Dict
+        content_analysis: Union[Dict, ContentAnalysis],
+        include_explanations: bool = True
     ) -> Dict:
         """
         Modify base TPB scores based on persona characteristics.
@@ -47,6 +515,9 @@ class PersonaTPBModifier:
                 }
             persona: Persona object with demographic, psychographic, and behavioral data
             content_analysis: Content analysis results including emotions, sentiment, topics
+                (dict or ContentAnalysis)
+            include_explanations: Build the modifications_applied strings; pass
+                False on hot paths to skip the formatting (the key is then None)
         
         Returns:
             Dictionary with persona-modified TPB scores:
@@ -58,7 +529,8 @@ class PersonaTPBModifier:
                 'attitude_modifier': float,
                 'norms_modifier': float,
                 'control_modifier': float,
-                'modifications_applied': List[str]
+                'modifications_applied': List[str] or None,
+                'modification_flags': int (MODIFIED_* bits)
             }
         
         Requirements: 12.1, 12.2
@@ -67,15 +539,31 @@ class PersonaTPBModifier:
         base_attitude = base_tpb.get('attitude', 50.0)
         base_norms = base_tpb.get('subjective_norms', 50.0)
         base_control = base_tpb.get('perceived_control', 50.0)
+        base_intention = base_tpb.get('behavioral_intention', 50.0)
+        content_analysis = _as_content(content_analysis)
+        
+        # Re-scoring the same persona, base scores and content reuses the result
+        key = (id(persona), base_attitude, base_norms, base_control, content_analysis)
+        entry = None
+        try:
+            with self._result_cache_lock:
+                entry = self._result_cache.get(key)
+                if entry is not None and entry[0]() is persona:
+                    self._result_cache.move_to_end(key)
+                else:
+                    entry = None
+        except TypeError:
+            key = None  # Unhashable content fields: score without memoization
+        if entry is not None:
+            _, cached, modifiers = entry
+            return dict(cached,
+                        modifications_applied=(explain(cached['modification_flags'], modifiers)
+                                               if include_explanations else None),
+                        base_attitude=base_attitude, base_norms=base_norms,
+                        base_control=base_control, base_intention=base_intention)
         
         # Calculate persona-specific modifiers
-        attitude_modifier = self._calculate_attitude_modifier(
-            persona, content_analysis
-        )
-        norms_modifier = self._calculate_norms_modifier(
-            persona, content_analysis
-        )
-        control_modifier = self._calculate_control_modifier(
+        attitude_modifier, norms_modifier, control_modifier = self._calculate_all_modifiers(
             persona, content_analysis
         )
         
@@ -93,16 +581,7 @@ class PersonaTPBModifier:
         )
         modified_intention = min(max(modified_intention, 0), 100)
         
-        # Track which modifications were applied
-        modifications_applied = []
-        if abs(attitude_modifier) > 0.05:
-            modifications_applied.append(f"Attitude: {attitude_modifier:+.2f}")
-        if abs(norms_modifier) > 0.05:
-            modifications_applied.append(f"Norms: {norms_modifier:+.2f}")
-        if abs(control_modifier) > 0.05:
-            modifications_applied.append(f"Control: {control_modifier:+.2f}")
-        
-        return {
+        result = {
             'attitude': round(modified_attitude, 2),
             'subjective_norms': round(modified_norms, 2),
             'perceived_control': round(modified_control, 2),
@@ -110,17 +589,54 @@ class PersonaTPBModifier:
             'attitude_modifier': round(attitude_modifier, 2),
             'norms_modifier': round(norms_modifier, 2),
             'control_modifier': round(control_modifier, 2),
-            'modifications_applied': modifications_applied,
+            'modifications_applied': None,
+            'modification_flags': modification_flags(attitude_modifier, norms_modifier,
+                                                     control_modifier),
             'base_attitude': base_attitude,
             'base_norms': base_norms,
             'base_control': base_control,
-            'base_intention': base_tpb.get('behavioral_intention', 50.0)
+            'base_intention': base_intention
         }
+        
+        modifiers = (attitude_modifier, norms_modifier, control_modifier)
+        if key is not None:
+            # Cache a copy so that callers may modify the returned dict
+            with self._result_cache_lock:
+                self._result_cache[key] = (weakref.ref(persona), dict(result), modifiers)
+                self._result_cache.move_to_end(key)
+                if len(self._result_cache) > TPB_RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+        
+        # Track which modifications were applied (formatted only on request)
+        if include_explanations:
+            result['modifications_applied'] = explain(result['modification_flags'], modifiers)
+        return result
+    
+    def _calculate_all_modifiers(
+        self,
+        persona: Persona,
+        content_analysis: Union[Dict, ContentAnalysis]
+    ) -> Tuple[float, float, float]:
+        """
+        Calculate the attitude, norms and control modifiers in one pass.
+        
+        Reads each content field once and accumulates the three modifiers
+        side by side (see the _calculate_*_modifier methods for what each
+        one captures), using the persona's specialized function from
+        _specialize_modifiers.
+        
+        Returns:
+            Tuple of (attitude_modifier, norms_modifier, control_modifier),
+            clamped to -0.5..+0.5, -0.5..+0.5 and -0.3..+0.3
+        
+        Requirements: 12.1, 12.2
+        """
+        return self._persona_entry(persona)[1](_as_content(content_analysis))
     
     def _calculate_attitude_modifier(
         self,
         persona: Persona,
-        content_analysis: Dict
+        content_analysis: Union[Dict, ContentAnalysis]
     ) -> float:
         """
         Calculate attitude modifier based on persona values and psychographics.
@@ -134,69 +650,12 @@ class PersonaTPBModifier:
         
         Requirements: 12.1
         """
-        modifier = 0.0
-        
-        # 1. Value Alignment Modifier (-0.2 to +0.2)
-        # Check if content values align with persona values
-        content_values = content_analysis.get('detected_values', [])
-        persona_values = persona.psychographics.core_values
-        
-        if content_values and persona_values:
-            # Calculate overlap
-            matching_values = set(content_values) & set(persona_values)
-            if matching_values:
-                # Positive modifier for value alignment
-                alignment_strength = len(matching_values) / max(len(persona_values), 1)
-                modifier += alignment_strength * 0.2
-            else:
-                # Check for value conflicts
-                conflicting_pairs = [
-                    ({'tradition', 'family'}, {'freedom', 'independence'}),
-                    ({'success', 'achievement'}, {'community', 'collective'}),
-                    ({'innovation', 'change'}, {'stability', 'tradition'})
-                ]
-                for persona_set, content_set in conflicting_pairs:
-                    if any(v in persona_values for v in persona_set) and \
-                       any(v in content_values for v in content_set):
-                        modifier -= 0.15
-                        break
-        
-        # 2. Personality (OCEAN) Modifier (-0.15 to +0.15)
-        # High openness: More receptive to creative/novel content
-        if content_analysis.get('is_creative', False) or content_analysis.get('is_novel', False):
-            openness_factor = (persona.psychographics.openness - 50) / 100
-            modifier += openness_factor * 0.15
-        
-        # High conscientiousness: Prefer factual/detailed content
-        if content_analysis.get('is_detailed', False) or content_analysis.get('has_facts', False):
-            conscientiousness_factor = (persona.psychographics.conscientiousness - 50) / 100
-            modifier += conscientiousness_factor * 0.1
-        
-        # High extraversion: Respond to social/energetic content
-        if content_analysis.get('is_social', False) or content_analysis.get('is_energetic', False):
-            extraversion_factor = (persona.psychographics.extraversion - 50) / 100
-            modifier += extraversion_factor * 0.1
-        
-        # 3. Interest Relevance Modifier (-0.15 to +0.15)
-        content_topics = content_analysis.get('topics', [])
-        persona_interests = persona.psychographics.interests
-        
-        if content_topics and persona_interests:
-            matching_interests = set(content_topics) & set(persona_interests)
-            if matching_interests:
-                interest_strength = len(matching_interests) / max(len(persona_interests), 1)
-                modifier += interest_strength * 0.15
-            elif len(set(content_topics) & set(persona.behavioral_triggers.ignore_triggers)) > 0:
-                # Content matches ignore triggers
-                modifier -= 0.15
-        
-        # Clamp modifier to -0.5 to +0.5
-        return max(min(modifier, 0.5), -0.5)
+        return self._calculate_all_modifiers(persona, content_analysis)[0]
     
     def _calculate_norms_modifier(
         self,
         persona: Persona,
-        content_analysis: Dict
+        content_analysis: Union[Dict, ContentAnalysis]
     ) -> float:
         """
         Calculate subjective norms modifier based on persona social factors.
@@ -210,56 +669,12 @@ class PersonaTPBModifier:
         
         Requirements: 12.2
         """
-        modifier = 0.0
-        
-        # 1. Cultural Collectivism Modifier (-0.2 to +0.2)
-        # Low individualism (high collectivism) = stronger social norms
-        collectivism_score = 100 - persona.cultural_profile.individualism
-        if collectivism_score > 60:
-            # Collectivist personas feel stronger social pressure
-            modifier += 0.2
-        elif collectivism_score < 40:
-            # Individualist personas feel less social pressure
-            modifier -= 0.15
-        
-        # 2. Family Orientation Modifier (0 to +0.15)
-        # High family orientation increases social pressure for family-related content
-        content_themes = content_analysis.get('themes', [])
-        if 'family' in content_themes or 'relationships' in content_themes:
-            if persona.cultural_profile.family_orientation > 70:
-                modifier += 0.15
-        
-        # 3. Status Consciousness Modifier (-0.15 to +0.15)
-        # High status consciousness increases social pressure for aspirational content
-        if content_analysis.get('is_aspirational', False) or \
-           content_analysis.get('is_premium', False):
-            status_factor = (persona.cultural_profile.status_consciousness - 50) / 100
-            modifier += status_factor * 0.15
-        
-        # 4. Sharing Propensity Modifier (-0.2 to +0.2)
-        sharing_map = {
-            'never': -0.2,
-            'selective': -0.05,
-            'frequent': 0.1,
-            'viral': 0.2
-        }
-        sharing_modifier = sharing_map.get(persona.media_behavior.sharing_propensity, 0)
-        modifier += sharing_modifier
-        
-        # 5. Platform Affinity Modifier (-0.15 to +0.15)
-        platform = content_analysis.get('platform', 'instagram').lower()
-        platform_affinity = persona.media_behavior.platform_affinity.get(platform, 0.5)
-        # Convert 0-1 affinity to -0.15 to +0.15 modifier
-        affinity_modifier = (platform_affinity - 0.5) * 0.3
-        modifier += affinity_modifier
-        
-        # Clamp modifier to -0.5 to +0.5
-        return max(min(modifier, 0.5), -0.5)
+        return self._calculate_all_modifiers(persona, content_analysis)[1]
     
     def _calculate_control_modifier(
         self,
         persona: Persona,
-        content_analysis: Dict
+        content_analysis: Union[Dict, ContentAnalysis]
     ) -> float:
         """
         Calculate perceived control modifier based on persona digital behavior.
@@ -273,48 +688,7 @@ class PersonaTPBModifier:
         
         Requirements: 12.2
         """
-        modifier = 0.0
-        
-        # 1. Engagement Style Modifier (-0.15 to +0.15)
-        # Active engagers feel more control over their actions
-        engagement_map = {
-            'passive': -0.15,
-            'reactive': -0.05,
-            'proactive': 0.1,
-            'creator': 0.15
-        }
-        engagement_modifier = engagement_map.get(persona.media_behavior.engagement_style, 0)
-        modifier += engagement_modifier
-        
-        # 2. Ad Receptivity Modifier (-0.15 to +0.1)
-        # Ad-averse personas feel less control (defensive)
-        # Ad-receptive personas feel more control (comfortable)
-        receptivity_map = {
-            'ad_blocker': -0.15,
-            'tolerant': -0.05,
-            'receptive': 0.05,
-            'engaged': 0.1
-        }
-        receptivity_modifier = receptivity_map.get(persona.media_behavior.ad_receptivity, 0)
-        modifier += receptivity_modifier
-        
-        # 3. Platform Familiarity Modifier (0 to +0.1)
-        # High platform affinity = more comfortable = more control
-        platform = content_analysis.get('platform', 'instagram').lower()
-        platform_affinity = persona.media_behavior.platform_affinity.get(platform, 0.5)
-        if platform_affinity > 0.7:
-            modifier += 0.1
-        elif platform_affinity < 0.3:
-            modifier -= 0.1
-        
-        # 4. Content Complexity Modifier (-0.1 to 0)
-        # Complex content reduces perceived control for less engaged personas
-        if content_analysis.get('is_complex', False):
-            if persona.media_behavior.engagement_style in ['passive', 'reactive']:
-                modifier -= 0.1
-        
-        # Clamp modifier to -0.3 to +0.3
-        return max(min(modifier, 0.3), -0.3)
+        return self._calculate_all_modifiers(persona, content_analysis)[2]
     
     def _apply_modifier(self, base_score: float, modifier: float) -> float:
         """
@@ -337,3 +711,316 @@ class PersonaTPBModifier:
         
         # Clamp to 0-100 range
         return max(min(modified_score, 100), 0)
+    
+    def modify_tpb_batch(self, base_tpbs: Sequence[Dict],
+                         personas: Union[Sequence[Persona], PersonaTable],
+                         content_analyses: Sequence[Union[Dict, ContentAnalysis]]) -> np.ndarray:
+        """
+        Modify base TPB scores for every (persona, content) pair at once.
+        
+        Applies the modify_tpb_for_persona formulas over a personas x content
+        grid: persona fields and content flags are packed into arrays once, and
+        value/interest overlaps are counted with a product of token-membership
+        matrices. The scores are then computed in a parallel Numba kernel when
+        available and with NumPy array operations otherwise. Results come back
+        as one packed record array rather than a dict per pair; the
+        modifications_applied strings and base scores are not built (use
+        tpb_batch_dicts for per-pair dicts and format_explanations for the
+        strings of the rows a report shows).
+        
+        Args:
+            base_tpbs: Base TPB score dicts, one per content analysis
+            personas: Personas to score (N), or a PersonaTable of them
+            content_analyses: Content analyses (M), as for modify_tpb_for_persona
+        
+        Returns:
+            (N, M) array of TPB_BATCH_DTYPE records (attitude, subjective_norms,
+            perceived_control, behavioral_intention and the three modifiers,
+            rounded to 2 decimals like modify_tpb_for_persona, and the
+            modification_flags of the unrounded modifiers)
+        """
+        if not isinstance(personas, PersonaTable):
+            personas = PersonaTable.from_personas(
+                personas, [self._features(persona) for persona in personas]
+            )
+        table = personas
+        
+        # Persona inputs, (N,)
+        value_count = table.core_value_count
+        interest_count = table.interest_count
+        openness_factor = table.openness_factor
+        conscientiousness_factor = table.conscientiousness_factor
+        extraversion_factor = table.extraversion_factor
+        collectivism = table.collectivism_score
+        collectivism_term = np.where(collectivism > 60, 0.2, np.where(collectivism < 40, -0.15, 0.0))
+        family_oriented = table.family_orientation > 70
+        status_factor = table.status_factor
+        sharing_term = np.take(np.array(SHARING_MODIFIERS, dtype=np.float64), table.sharing_code)
+        control_base = (np.take(np.array(ENGAGEMENT_MODIFIERS, dtype=np.float64), table.engagement_code)
+                        + np.take(np.array(RECEPTIVITY_MODIFIERS, dtype=np.float64),
+                                  table.receptivity_code))
+        low_engagement = np.isin(table.engagement_code, LOW_ENGAGEMENT_STYLES)
+        
+        # Content inputs, (M,)
+        contents = [_as_content(content) for content in content_analyses]
+        content_values = [content.detected_values for content in contents]
+        content_topics = [content.topics for content in contents]
+        creative = np.array([c.is_creative or c.is_novel for c in contents], dtype=np.bool_)
+        detailed = np.array([c.is_detailed or c.has_facts for c in contents], dtype=np.bool_)
+        social = np.array([c.is_social or c.is_energetic for c in contents], dtype=np.bool_)
+        family_theme = np.array([
+            'family' in c.themes or 'relationships' in c.themes for c in contents
+        ], dtype=np.bool_)
+        aspirational = np.array([c.is_aspirational or c.is_premium for c in contents], dtype=np.bool_)
+        complex_content = np.array([c.is_complex for c in contents], dtype=np.bool_)
+        base_attitude = np.array([b.get('attitude', 50.0) for b in base_tpbs], dtype=np.float64)
+        base_norms = np.array([b.get('subjective_norms', 50.0) for b in base_tpbs], dtype=np.float64)
+        base_control = np.array([b.get('perceived_control', 50.0) for b in base_tpbs], dtype=np.float64)
+        
+        # Pair inputs, (N, M); overlaps only count where both sides are non-empty
+        has_values = (np.array([bool(values) for values in table.core_values], dtype=np.bool_)[:, None]
+                      & np.array([bool(values) for values in content_values], dtype=np.bool_))
+        value_matches = np.where(
+            has_values, _overlap_counts(table.core_values, content_values), 0.0
+        )
+        value_conflict = has_values & (
+            (_conflict_masks(table.core_values)[:, None] & _conflict_bits(content_values)) != 0
+        )
+        has_topics = (np.array([bool(interests) for interests in table.interests],
+                               dtype=np.bool_)[:, None]
+                      & np.array([bool(topics) for topics in content_topics], dtype=np.bool_))
+        interest_matches = np.where(
+            has_topics, _overlap_counts(table.interests, content_topics), 0.0
+        )
+        ignored = has_topics & (
+            _overlap_counts(table.ignore_triggers, content_topics) > 0
+        )
+        
+        # Affinity of each persona for each content's platform; platforms no
+        # persona lists map to the extra 0.5 (neutral) column
+        platform_column = {platform: index for index, platform in enumerate(table.platforms)}
+        platform_ids = np.array([
+            platform_column.get(content.platform, len(table.platforms)) for content in contents
+        ], dtype=np.intp)
+        affinity_table = np.concatenate(
+            [table.platform_affinity, np.full((len(table.platform_affinity), 1), 0.5)], axis=1
+        )
+        platform_affinity = np.take(affinity_table, platform_ids, axis=1)
+        
+        if NUMBA_AVAILABLE:
+            scores, flags = tpb_batch_kernel(
+                value_count, interest_count, openness_factor, conscientiousness_factor,
+                extraversion_factor, collectivism_term, family_oriented, status_factor,
+                sharing_term, control_base, low_engagement,
+                creative, detailed, social, family_theme, aspirational, complex_content,
+                base_attitude, base_norms, base_control,
+                value_matches, value_conflict, interest_matches, ignored, platform_affinity
+            )
+            return _batch_records(scores, flags)
+        
+        # Attitude: value alignment (or conflict), personality fit, interest relevance
+        attitude_modifier = np.where(
+            value_matches > 0,
+            value_matches / value_count[:, None] * 0.2,
+            np.where(value_conflict, -0.15, 0.0)
+        )
+        attitude_modifier += np.where(
+            creative, openness_factor[:, None] * 0.15, 0.0
+        )
+        attitude_modifier += np.where(
+            detailed, conscientiousness_factor[:, None] * 0.1, 0.0
+        )
+        attitude_modifier += np.where(
+            social, extraversion_factor[:, None] * 0.1, 0.0
+        )
+        attitude_modifier += np.where(
+            interest_matches > 0,
+            interest_matches / interest_count[:, None] * 0.15,
+            np.where(ignored, -0.15, 0.0)
+        )
+        np.clip(attitude_modifier, -0.5, 0.5, out=attitude_modifier)
+        
+        # Subjective norms: collectivism, family orientation, status, sharing, platform affinity
+        norms_modifier = collectivism_term[:, None] + np.where(
+            family_oriented[:, None] & family_theme, 0.15, 0.0
+        )
+        norms_modifier += np.where(
+            aspirational, status_factor[:, None] * 0.15, 0.0
+        )
+        norms_modifier += sharing_term[:, None]
+        norms_modifier += (platform_affinity - 0.5) * 0.3
+        np.clip(norms_modifier, -0.5, 0.5, out=norms_modifier)
+        
+        # Perceived control: engagement and receptivity, platform familiarity, complexity
+        control_modifier = control_base[:, None] + np.where(
+            platform_affinity > 0.7, 0.1, np.where(platform_affinity < 0.3, -0.1, 0.0)
+        )
+        control_modifier += np.where(
+            low_engagement[:, None] & complex_content, -0.1, 0.0
+        )
+        np.clip(control_modifier, -0.3, 0.3, out=control_modifier)
+        
+        # Apply modifiers to the base scores (one per content) and blend the intention;
+        # clips run in place on the fresh result arrays
+        attitude = base_attitude * (1 + attitude_modifier)
+        np.clip(attitude, 0, 100, out=attitude)
+        norms = base_norms * (1 + norms_modifier)
+        np.clip(norms, 0, 100, out=norms)
+        control = base_control * (1 + control_modifier)
+        np.clip(control, 0, 100, out=control)
+        intention = attitude * 0.40 + norms * 0.35 + control * 0.25
+        np.clip(intention, 0, 100, out=intention)
+        
+        flags = modification_flags(attitude_modifier, norms_modifier, control_modifier)
+        scores = np.stack([attitude, norms, control, intention,
+                           attitude_modifier, norms_modifier, control_modifier], axis=-1)
+        return _batch_records(round_2dp_array(scores), flags)
+    
+    def modify_tpb_batch_parallel(self, base_tpbs: Sequence[Dict],
+                                  personas: Union[Sequence[Persona], PersonaTable],
+                                  content_analyses: Sequence[Union[Dict, ContentAnalysis]],
+                                  max_workers: int = None) -> np.ndarray:
+        """
+        modify_tpb_batch for large grids, split into persona row chunks scored
+        on a thread pool.
+        
+        With Numba the kernel already spreads the personas across all cores,
+        so the grid is scored in one call. Without it the NumPy array
+        operations release the GIL, and chunks run concurrently; the content
+        analyses are converted once and shared by every chunk.
+        
+        Args:
+            max_workers: Number of chunks/threads (default: CPU count)
+        
+        Returns:
+            (N, M) array of TPB_BATCH_DTYPE records, as modify_tpb_batch
+        """
+        if not isinstance(personas, PersonaTable):
+            personas = PersonaTable.from_personas(
+                personas, [self._features(persona) for persona in personas]
+            )
+        contents = [_as_content(content) for content in content_analyses]
+        workers = min(max_workers or os.cpu_count() or 1, len(personas.core_values))
+        if NUMBA_AVAILABLE or workers <= 1:
+            return self.modify_tpb_batch(base_tpbs, personas, contents)
+        
+        bounds = np.linspace(0, len(personas.core_values), workers + 1).astype(int)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            chunks = list(executor.map(
+                lambda start, stop: self.modify_tpb_batch(
+                    base_tpbs, personas.take_rows(slice(start, stop)), contents
+                ),
+                bounds[:-1], bounds[1:]
+            ))
+        return np.concatenate(chunks)
+
+
+def modification_flags(attitude_modifier, norms_modifier, control_modifier):
+    """
+    MODIFIED_* bits of the modifiers that move a score by more than 5%.
+    
+    Takes floats (returning an int) or equally shaped arrays (returning an
+    integer array).
+    """
+    return ((abs(attitude_modifier) > 0.05)
+            | ((abs(norms_modifier) > 0.05) << 1)
+            | ((abs(control_modifier) > 0.05) << 2))
+
+
+def explain(flags: int, modifiers: Tuple[float, float, float]) -> List[str]:
+    """
+    Format modification flags as modifications_applied strings.
+    
+    Args:
+        flags: MODIFIED_* bits, from modification_flags
+        modifiers: (attitude_modifier, norms_modifier, control_modifier)
+    
+    Returns:
+        e.g. ['Attitude: +0.20', 'Control: -0.10']
+    """
+    attitude_modifier, norms_modifier, control_modifier = modifiers
+    modifications_applied = []
+    if flags & MODIFIED_ATTITUDE:
+        modifications_applied.append(f"Attitude: {attitude_modifier:+.2f}")
+    if flags & MODIFIED_NORMS:
+        modifications_applied.append(f"Norms: {norms_modifier:+.2f}")
+    if flags & MODIFIED_CONTROL:
+        modifications_applied.append(f"Control: {control_modifier:+.2f}")
+    return modifications_applied
+
+
+def format_explanations(results: np.ndarray) -> List[List[str]]:
+    """
+    modifications_applied strings for modify_tpb_batch records.
+    
+    Meant for the few rows a report shows rather than the whole grid; pass a
+    slice (e.g. results[i] or results[i, j:j + 1]).
+    
+    Returns:
+        One list of strings per record, in the order of results.ravel()
+    """
+    records = np.atleast_1d(results).ravel()
+    return [
+        explain(flags, modifiers)
+        for flags, modifiers in zip(
+            records['modification_flags'].tolist(),
+            zip(records['attitude_modifier'].tolist(), records['norms_modifier'].tolist(),
+                records['control_modifier'].tolist())
+        )
+    ]
+
+
+def tpb_batch_dicts(results: np.ndarray) -> List[List[Dict]]:
+    """
+    Unpack a modify_tpb_batch result into per-pair score dicts.
+    
+    Returns:
+        One list per persona of one dict per content analysis, keyed like the
+        modify_tpb_for_persona scores (attitude ... control_modifier,
+        modification_flags)
+    """
+    names = results.dtype.names
+    return [[dict(zip(names, record)) for record in row] for row in results.tolist()]
+
+
+def _batch_records(scores: np.ndarray, flags: np.ndarray) -> np.ndarray:
+    """Pack (N, M, 7) rounded scores and (N, M) modification flags into TPB_BATCH_DTYPE records"""
+    records = np.empty(flags.shape, dtype=TPB_BATCH_DTYPE)
+    for column, name in enumerate(TPB_BATCH_DTYPE.names[:-1]):
+        records[name] = scores[..., column]
+    records['modification_flags'] = flags
+    return records
+
+
+def _overlap_counts(persona_sets: Sequence[FrozenSet[str]], content_lists: List) -> np.ndarray:
+    """(N, M) sizes of the intersections of each persona set with each content list"""
+    vocabulary = {}
+    for tokens in persona_sets:
+        for token in tokens:
+            vocabulary.setdefault(token, len(vocabulary))
+    
+    persona_matrix = np.zeros((len(persona_sets), len(vocabulary)))
+    for row, tokens in enumerate(persona_sets):
+        persona_matrix[row, [vocabulary[token] for token in tokens]] = 1.0
+    content_matrix = np.zeros((len(content_lists), len(vocabulary)))
+    for row, tokens in enumerate(content_lists):
+        columns = [vocabulary[token] for token in tokens if token in vocabulary]
+        content_matrix[row, columns] = 1.0
+    return persona_matrix @ content_matrix.T
+
+
+def _conflict_bits(token_lists: Sequence) -> np.ndarray:
+    """uint64 masks of the VALUE_CONFLICTS tokens in each token list"""
+    return np.array([_content_mask(tokens) & CONFLICT_TOKENS_MASK for tokens in token_lists],
+                    dtype=np.uint64)
+
+
+def _conflict_masks(persona_values: Sequence[FrozenSet[str]]) -> np.ndarray:
+    """
+    uint64 masks of the content values conflicting with each persona's values
+    (the content side of every VALUE_CONFLICTS pair whose persona side it hits)
+    """
+    hits = (_conflict_bits(persona_values)[:, None] & CONFLICT_PERSONA_MASKS) != 0
+    return np.bitwise_or.reduce(
+        np.where(hits, CONFLICT_CONTENT_MASKS, np.uint64(0)), axis=1
+    ).astype(np.uint64)
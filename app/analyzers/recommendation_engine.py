@@ -198,8 +198,15 @@ class RecommendationEngine:
         if len(cultural_alerts) == 0:
             reasoning.append("No cultural sensitivity issues detected")
         else:
-            critical_count = sum(1 for a in cultural_alerts if a.get('severity') == 'critical')
-            high_count = sum(1 for a in cultural_alerts if a.get('severity') == 'high')
+            # Count both severities in one pass over the alerts
+            critical_count = 0
+            high_count = 0
+            for alert in cultural_alerts:
+                severity = alert.get('severity')
+                if severity == 'critical':
+                    critical_count += 1
+                elif severity == 'high':
+                    high_count += 1
             
             if critical_count > 0:
                 reasoning.append(f"{critical_count} critical cultural sensitivity alert(s) detected")
@@ -0,0 +1,104 @@
+# AdsenseAI Campaign Risk Analyzer - TPB Kernels Module
+# Batched persona TPB modifier math behind PersonaTPBModifier, JIT-compiled with Numba when available
+
+from typing import Tuple
+
+import numpy as np
+
+from .outcome_kernels import _jit_parallel, prange, round_2dp
+
+
+@_jit_parallel
+def tpb_batch_kernel(value_count, interest_count, openness_factor, conscientiousness_factor,
+                     extraversion_factor, collectivism_term, family_oriented, status_factor,
+                     sharing_term, control_base, low_engagement,
+                     creative, detailed, social, family_theme, aspirational, complex_content,
+                     base_attitude, base_norms, base_control,
+                     value_matches, value_conflict, interest_matches, ignored,
+                     platform_affinity) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Persona TPB modifier math over a personas x content grid, one prange
+    iteration per persona (see PersonaTPBModifier.modify_tpb_for_persona).
+    
+    Persona inputs are (N,) arrays, content inputs (M,) arrays and the
+    overlap/affinity inputs (N, M) arrays; value_matches/value_conflict are
+    zero where either side has no values, and interest_matches/ignored where
+    either side has no topics.
+    
+    Only worth calling with Numba available; without it this is a plain
+    Python loop.
+    
+    Returns:
+        Tuple of (scores, flags): scores is a float64 array of shape (N, M, 7),
+        rounded to 2 decimals, with columns (attitude, subjective_norms,
+        perceived_control, behavioral_intention, attitude_modifier,
+        norms_modifier, control_modifier); flags is an (N, M) uint8 array of
+        the MODIFIED_* bits of the unrounded modifiers
+    """
+    n = value_matches.shape[0]
+    m = value_matches.shape[1]
+    scores = np.empty((n, m, 7))
+    flags = np.zeros((n, m), dtype=np.uint8)
+    for i in prange(n):
+        for j in range(m):
+            # Attitude: value alignment (or conflict), personality fit, interest relevance
+            modifier = 0.0
+            if value_matches[i, j] > 0:
+                modifier += value_matches[i, j] / value_count[i] * 0.2
+            elif value_conflict[i, j]:
+                modifier -= 0.15
+            if creative[j]:
+                modifier += openness_factor[i] * 0.15
+            if detailed[j]:
+                modifier += conscientiousness_factor[i] * 0.1
+            if social[j]:
+                modifier += extraversion_factor[i] * 0.1
+            if interest_matches[i, j] > 0:
+                modifier += interest_matches[i, j] / interest_count[i] * 0.15
+            elif ignored[i, j]:
+                modifier -= 0.15
+            att_mod = max(min(modifier, 0.5), -0.5)
+            
+            # Subjective norms: collectivism, family orientation, status, sharing, platform affinity
+            modifier = collectivism_term[i]
+            if family_theme[j] and family_oriented[i]:
+                modifier += 0.15
+            if aspirational[j]:
+                modifier += status_factor[i] * 0.15
+            modifier += sharing_term[i]
+            modifier += (platform_affinity[i, j] - 0.5) * 0.3
+            norm_mod = max(min(modifier, 0.5), -0.5)
+            
+            # Perceived control: engagement and receptivity, platform familiarity, complexity
+            modifier = control_base[i]
+            if platform_affinity[i, j] > 0.7:
+                modifier += 0.1
+            elif platform_affinity[i, j] < 0.3:
+                modifier -= 0.1
+            if complex_content[j] and low_engagement[i]:
+                modifier -= 0.1
+            ctrl_mod = max(min(modifier, 0.3), -0.3)
+            
+            att = max(min(base_attitude[j] * (1 + att_mod), 100.0), 0.0)
+            norm = max(min(base_norms[j] * (1 + norm_mod), 100.0), 0.0)
+            ctrl = max(min(base_control[j] * (1 + ctrl_mod), 100.0), 0.0)
+            blend = max(min(att * 0.40 + norm * 0.35 + ctrl * 0.25, 100.0), 0.0)
+            
+            scores[i, j, 0] = round_2dp(att)
+            scores[i, j, 1] = round_2dp(norm)
+            scores[i, j, 2] = round_2dp(ctrl)
+            scores[i, j, 3] = round_2dp(blend)
+            scores[i, j, 4] = round_2dp(att_mod)
+            scores[i, j, 5] = round_2dp(norm_mod)
+            scores[i, j, 6] = round_2dp(ctrl_mod)
+            
+            # Modifiers that move their score by more than 5% (modification_flags)
+            flag = 0
+            if abs(att_mod) > 0.05:
+                flag |= 1
+            if abs(norm_mod) > 0.05:
+                flag |= 2
+            if abs(ctrl_mod) > 0.05:
+                flag |= 4
+            flags[i, j] = flag
+    return scores, flags
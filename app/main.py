@@ -1,6 +1,7 @@
 # AdsenseAI Campaign Risk Analyzer - Main FastAPI Application
 
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
@@ -33,7 +34,7 @@ from app.models import (
 # Import analyzers
 from app.analyzers import (
     TextAnalyzer,
-    CulturalSensitivityDetector,
+    get_cultural_sensitivity_detector,
     PerceivedIntentCalculator,
     TPBCalculator,
     OutcomePredictor,
@@ -43,7 +44,7 @@ from app.analyzers import (
 )
 
 # Import persona analyzers
-from app.analyzers.persona_library import PersonaLibrary
+from app.analyzers.persona_library import get_persona_library
 from app.analyzers.resonance_calculator import ResonanceCalculator
 from app.analyzers.persona_tpb_modifier import PersonaTPBModifier
 
@@ -95,7 +96,7 @@ def initialize_system():
         
         # Initialize analyzers
         text_analyzer = TextAnalyzer()
-        cultural_detector = CulturalSensitivityDetector()
+        cultural_detector = get_cultural_sensitivity_detector()
         intent_calculator = PerceivedIntentCalculator()
         tpb_calculator = TPBCalculator()
         outcome_predictor = OutcomePredictor()
@@ -111,7 +112,7 @@ def initialize_system():
         
         # Initialize persona testing components
         try:
-            persona_library = PersonaLibrary()
+            persona_library = get_persona_library()
             resonance_calculator = ResonanceCalculator()
             persona_tpb_modifier = PersonaTPBModifier()
             logger.info("Persona testing components initialized")
@@ -365,7 +366,10 @@ async def analyze_campaign(request: PersonaAnalysisRequest):
         if analysis_type == "image_only" and image_analyzer:
             try:
                 logger.info("Step 0: Extracting text from image (OCR)...")
-                ocr_result = image_analyzer.extract_text_from_image(request.image_base64)
+                # Gemini calls (and their retry backoff) block, so keep them off the event loop
+                ocr_result = await run_in_threadpool(
+                    image_analyzer.extract_text_from_image, request.image_base64
+                )
                 
                 if ocr_result.get('extracted_text'):
                     extracted_text = ocr_result['extracted_text']
@@ -392,11 +396,15 @@ async def analyze_campaign(request: PersonaAnalysisRequest):
         emc_result = text_analyzer.calculate_emc_score(caption_text)
         nam_result = text_analyzer.calculate_nam_score(caption_text)
         
+        # Lowercased once for the keyword scans in steps 2 and 5
+        caption_lower = caption_text.lower()
+        
         # Step 2: Cultural Sensitivity Detection
         logger.info("Step 2: Detecting cultural sensitivity issues...")
         cultural_result = cultural_detector.calculate_scs_score(
             text=caption_text,
-            posting_date=request.posting_date
+            posting_date=request.posting_date,
+            text_lower=caption_lower
         )
         
         # Step 3: Image Analysis (if image provided)
@@ -405,7 +413,9 @@ async def analyze_campaign(request: PersonaAnalysisRequest):
                 logger.info("Step 3: Analyzing image content...")
                 
                 # Pass the base64 string directly - analyze_image handles the parsing
-                image_analysis_result = image_analyzer.analyze_image(request.image_base64)
+                image_analysis_result = await run_in_threadpool(
+                    image_analyzer.analyze_image, request.image_base64
+                )
                 
                 # Check if there was an error in the analysis
                 if image_analysis_result.get('error'):
@@ -446,7 +456,8 @@ async def analyze_campaign(request: PersonaAnalysisRequest):
             nam_score=nam_result['nam_score'],
             scs_score=cultural_result['scs_score'],
             sentiment=sentiment,
-            text=caption_text  # CRITICAL FIX 2: Pass text for manipulation detection
+            text=caption_text,  # CRITICAL FIX 2: Pass text for manipulation detection
+            text_lower=caption_lower
         )
         
         # Step 6: TPB Framework Calculation
@@ -472,7 +483,8 @@ async def analyze_campaign(request: PersonaAnalysisRequest):
             scs_score=cultural_result['scs_score'],
             cultural_alerts=cultural_result['detected_triggers'] + cultural_result['festival_proximity'],
             caption=caption_text,
-            emc_score=emc_result['emc_score']  # CRITICAL FIX 4: Pass EMC score for backlash calculation
+            emc_score=emc_result['emc_score'],  # CRITICAL FIX 4: Pass EMC score for backlash calculation
+            include_breakdown=False  # Only the top-level scores are used below
         )
         
         # Step 8: Generate Recommendations
@@ -116,7 +116,7 @@ class ImageAnalysis(BaseModel):
 # Requirements: 1.2, 2.1-2.4
 # ============================================================================
 
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import Tuple
 
 
@@ -361,6 +361,45 @@ class MediaBehavior(BaseModel):
     brand_loyalty: str = Field(..., description="Brand loyalty: 'switcher', 'neutral', 'loyal', 'advocate'")
 
 
+class LabelCode(IntEnum):
+    """Integer codes for a fixed set of lowercase labels, with OTHER for any other label"""
+    
+    @classmethod
+    def from_label(cls, label: str) -> 'LabelCode':
+        """Code for a label (case-sensitive, like the label lookups it replaces)"""
+        member = cls.__members__.get(label.upper())
+        if member is None or member.name.lower() != label:
+            return cls.OTHER
+        return member
+
+
+class SharingPropensity(LabelCode):
+    """Codes for MediaBehavior.sharing_propensity"""
+    NEVER = 0
+    SELECTIVE = 1
+    FREQUENT = 2
+    VIRAL = 3
+    OTHER = 4
+
+
+class EngagementStyle(LabelCode):
+    """Codes for MediaBehavior.engagement_style"""
+    PASSIVE = 0
+    REACTIVE = 1
+    PROACTIVE = 2
+    CREATOR = 3
+    OTHER = 4
+
+
+class AdReceptivity(LabelCode):
+    """Codes for MediaBehavior.ad_receptivity"""
+    AD_BLOCKER = 0
+    TOLERANT = 1
+    RECEPTIVE = 2
+    ENGAGED = 3
+    OTHER = 4
+
+
 class BehavioralTriggers(BaseModel):
     """Content elements that drive specific responses"""
     # Positive Triggers (increase engagement)
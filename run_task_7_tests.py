@@ -5,6 +5,7 @@ Runs all tests for Task 7 in sequence:
 - 7.1: Persona loading tests
 - 7.2: Analysis pipeline tests
 - 7.3: UI interaction tests
+- Batch scoring tests
 """
 
 import sys
@@ -77,6 +78,13 @@ def main():
             "description": "Subtask 7.3 - UI Interaction Tests",
             "requirements": "Req 9.1-9.5"
         },
+
+        # Batch scoring paths match the scalar methods
+        {
+            "file": "test_batch_scoring.py",
+            "description": "Batch Scoring Tests",
+            "requirements": "Req 4.4, 4.5"
+        },
     ]
     
     results = []
@@ -0,0 +1,313 @@
+"""
+Batch Scoring Tests
+
+Checks that the batch scoring paths return exactly what the scalar methods
+return for the same inputs:
+- PersonaTPBModifier.modify_tpb_batch (and its PersonaTable / parallel forms)
+  vs modify_tpb_for_persona
+- OutcomePredictor.predict_all_outcomes_batch vs predict_all_outcomes
+- PerceivedIntentCalculator.calculate_perceived_intent_batch vs
+  calculate_perceived_intent
+
+Inputs are drawn from a seeded generator so failures are reproducible. When
+Numba is installed the whole suite is run a second time in a subprocess with
+NUMBA_DISABLE_JIT=1, which executes the kernels as plain Python.
+"""
+
+import math
+import os
+import random
+import subprocess
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.analyzers.outcome_predictor import OutcomePredictor
+from app.analyzers.perceived_intent_calculator import PerceivedIntentCalculator
+from app.analyzers.persona_library import get_persona_library
+from app.analyzers.persona_tpb_modifier import (
+    PersonaTable,
+    PersonaTPBModifier,
+    format_explanations,
+    tpb_batch_dicts,
+)
+
+try:
+    import numba  # noqa: F401
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+SEED = 20240601
+
+CONTENT_FLAGS = [
+    'is_creative', 'is_novel', 'is_detailed', 'has_facts', 'is_social',
+    'is_energetic', 'is_aspirational', 'is_premium', 'is_complex',
+]
+TPB_PLATFORMS = ['instagram', 'Instagram', 'YOUTUBE', 'twitter', 'facebook',
+                 'whatsapp', 'linkedin', 'reddit', 'tiktok', None]
+TPB_KEYS = ['attitude', 'subjective_norms', 'perceived_control', 'behavioral_intention',
+            'attitude_modifier', 'norms_modifier', 'control_modifier', 'modification_flags']
+
+
+def same_number(a, b):
+    """Equal values, including the sign of zero"""
+    a, b = float(a), float(b)
+    return a == b and math.copysign(1, a) == math.copysign(1, b)
+
+
+class TestPersonaTPBBatch(unittest.TestCase):
+    """modify_tpb_batch vs modify_tpb_for_persona"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.modifier = PersonaTPBModifier()
+        cls.personas = get_persona_library().get_all_personas()
+        cls.values = sorted(
+            {v for p in cls.personas for v in p.psychographics.core_values}
+            | {'tradition', 'family', 'freedom', 'success', 'community', 'innovation', 'xyz'}
+        )
+        cls.topics = sorted(
+            {t for p in cls.personas for t in p.psychographics.interests}
+            | {t for p in cls.personas for t in p.behavioral_triggers.ignore_triggers}
+            | {'zzz'}
+        )
+
+    def make_case(self, rng):
+        content = {}
+        for flag in CONTENT_FLAGS:
+            r = rng.random()
+            if r < 0.4:
+                content[flag] = True
+            elif r < 0.6:
+                content[flag] = False
+        if rng.random() < 0.8:
+            content['detected_values'] = rng.sample(self.values, rng.randint(0, 4))
+        if rng.random() < 0.8:
+            content['topics'] = rng.sample(self.topics, rng.randint(0, 4))
+        if rng.random() < 0.7:
+            content['themes'] = rng.sample(['family', 'relationships', 'x'], rng.randint(0, 2))
+        platform = rng.choice(TPB_PLATFORMS)
+        if platform:
+            content['platform'] = platform
+
+        base = {}
+        for key in ['attitude', 'subjective_norms', 'perceived_control', 'behavioral_intention']:
+            if rng.random() < 0.9:
+                base[key] = rng.choice([rng.uniform(0, 100), float(rng.randint(0, 100)), 0.0, 100.0])
+        return base, content
+
+    def assert_matches_scalar(self, results, personas, cases):
+        self.assertEqual(results.shape, (len(personas), len(cases)))
+        for i, persona in enumerate(personas):
+            for j, (base, content) in enumerate(cases):
+                expected = self.modifier.modify_tpb_for_persona(base, persona, content)
+                for key in TPB_KEYS:
+                    self.assertTrue(
+                        same_number(results[key][i, j], expected[key]),
+                        f"{key} for {persona.id}, case {j}: "
+                        f"batch {results[key][i, j]!r} != scalar {expected[key]!r}"
+                    )
+                self.assertEqual(
+                    format_explanations(results[i, j:j + 1])[0],
+                    expected['modifications_applied'],
+                    f"explanations for {persona.id}, case {j}"
+                )
+
+    def test_batch_matches_scalar(self):
+        rng = random.Random(SEED)
+        for _ in range(4):
+            cases = [self.make_case(rng) for _ in range(rng.randint(1, 40))]
+            results = self.modifier.modify_tpb_batch(
+                [b for b, _ in cases], self.personas, [c for _, c in cases]
+            )
+            self.assert_matches_scalar(results, self.personas, cases)
+
+    def test_persona_table_and_parallel_match_batch(self):
+        rng = random.Random(SEED + 1)
+        cases = [self.make_case(rng) for _ in range(30)]
+        base_tpbs = [b for b, _ in cases]
+        contents = [c for _, c in cases]
+        expected = self.modifier.modify_tpb_batch(base_tpbs, self.personas, contents)
+
+        table = PersonaTable.from_personas(self.personas)
+        self.assertEqual(
+            self.modifier.modify_tpb_batch(base_tpbs, table, contents).tobytes(),
+            expected.tobytes()
+        )
+        self.assertEqual(
+            self.modifier.modify_tpb_batch_parallel(base_tpbs, table, contents, max_workers=3).tobytes(),
+            expected.tobytes()
+        )
+
+        rows = slice(1, len(self.personas) - 1)
+        self.assertEqual(
+            self.modifier.modify_tpb_batch(base_tpbs, table.take_rows(rows), contents).tobytes(),
+            expected[rows].tobytes()
+        )
+
+    def test_empty_and_dicts(self):
+        rng = random.Random(SEED + 2)
+        cases = [self.make_case(rng) for _ in range(3)]
+
+        empty = self.modifier.modify_tpb_batch([], self.personas, [])
+        self.assertEqual(empty.shape, (len(self.personas), 0))
+
+        results = self.modifier.modify_tpb_batch(
+            [b for b, _ in cases], self.personas, [c for _, c in cases]
+        )
+        dicts = tpb_batch_dicts(results)
+        self.assertEqual(len(dicts), len(self.personas))
+        self.assertIs(type(dicts[0][0]['attitude']), float)
+        self.assertEqual(dicts[-1][-1]['attitude'], results['attitude'][-1, -1])
+
+
+class TestOutcomeBatch(unittest.TestCase):
+    """predict_all_outcomes_batch vs predict_all_outcomes"""
+
+    PLATFORMS = ['instagram', 'Instagram', 'TIKTOK', 'youtube', 'twitter', 'facebook',
+                 'LinkedIn', 'unknown', '']
+    EMOTIONS = ['joy', 'pride', 'fear', 'anger', 'trust', 'sadness', 'surprise']
+    SEVERITIES = ['critical', 'high', 'medium', 'low', None]
+    WORDS = ['sale', '#deal', '#diwali', 'buy', 'now', 'great', 'offer', '#new', 'family', 'love']
+
+    def make_case(self, rng):
+        alerts = []
+        for _ in range(rng.randint(0, 6)):
+            alert = {}
+            if rng.random() < 0.9:
+                alert['risk_weight'] = rng.choice([rng.randint(0, 40), rng.uniform(0, 40)])
+            severity = rng.choice(self.SEVERITIES)
+            if severity:
+                alert['severity'] = severity
+            alerts.append(alert)
+
+        word_count = rng.choice([rng.randint(0, 20), 50, 51, 100, 101, rng.randint(0, 150)])
+        caption = ' '.join(rng.choice(self.WORDS) for _ in range(word_count))
+
+        sentiment = {}
+        if rng.random() < 0.95:
+            sentiment['polarity'] = rng.choice([rng.uniform(-1, 1), 0.3, 0.5, 0.6, -0.3, -0.6, 0.0, -1.0, 1.0])
+        if rng.random() < 0.95:
+            sentiment['subjectivity'] = rng.choice([rng.uniform(0, 1), 0.7, 0.0])
+
+        return dict(
+            behavioral_intention=rng.choice([rng.uniform(0, 100), rng.randint(0, 100)]),
+            emotions=rng.sample(self.EMOTIONS, rng.randint(0, 7)),
+            sentiment=sentiment,
+            platform=rng.choice(self.PLATFORMS),
+            perceived_intent=rng.choice([rng.uniform(-100, 100), -50, -20, 0, 20, 19.999]),
+            scs_score=rng.uniform(0, 100),
+            cultural_alerts=alerts,
+            caption=caption,
+            emc_score=rng.choice([rng.uniform(0, 100), 70, 100, 0]),
+        )
+
+    def test_batch_matches_scalar(self):
+        predictor = OutcomePredictor()
+        rng = random.Random(SEED)
+        cases = [self.make_case(rng) for _ in range(3000)]
+
+        def column(fn):
+            return [fn(c) for c in cases]
+
+        batch = predictor.predict_all_outcomes_batch(
+            column(lambda c: c['behavioral_intention']),
+            column(lambda c: len(c['emotions'])),
+            column(lambda c: c['sentiment'].get('polarity', 0.0)),
+            column(lambda c: c['sentiment'].get('subjectivity', 0.0)),
+            column(lambda c: c['platform']),
+            column(lambda c: c['perceived_intent']),
+            column(lambda c: sum(a.get('risk_weight', 0) for a in c['cultural_alerts'])),
+            column(lambda c: sum(1 for a in c['cultural_alerts'] if a.get('severity') == 'critical')),
+            column(lambda c: sum(1 for a in c['cultural_alerts'] if a.get('severity') == 'high')),
+            column(lambda c: len(c['caption'].split())),
+            column(lambda c: c['caption'].count('#')),
+            column(lambda c: c['emc_score']),
+        )
+
+        fields = [
+            ('virality_score', lambda r: r['virality_score']),
+            ('backlash_risk', lambda r: r['backlash_risk']),
+            ('exposure_intensity', lambda r: r['exposure_intensity']),
+            ('ad_fatigue_risk', lambda r: r['ad_fatigue_risk']),
+            ('virality_category', lambda r: r['virality_breakdown']['category']),
+            ('backlash_category', lambda r: r['backlash_breakdown']['category']),
+            ('exposure_category', lambda r: r['exposure_breakdown']['category']),
+            ('fatigue_category', lambda r: r['fatigue_breakdown']['category']),
+        ]
+        for i, case in enumerate(cases):
+            expected = predictor.predict_all_outcomes(**case)
+            for name, get in fields:
+                self.assertEqual(
+                    batch[name][i], get(expected),
+                    f"{name} for case {i}: batch {batch[name][i]!r} != scalar {get(expected)!r}"
+                )
+
+
+class TestPerceivedIntentBatch(unittest.TestCase):
+    """calculate_perceived_intent_batch vs calculate_perceived_intent"""
+
+    TEXTS = ['dont let this problem hold you back, finally a solution',
+             'act now limited offer today', 'hello world', 'ugly? say goodbye',
+             'because of your job', '']
+
+    def test_batch_matches_scalar(self):
+        calculator = PerceivedIntentCalculator()
+        rng = random.Random(SEED)
+
+        def pick(low, high, specials):
+            return rng.choice([rng.uniform(low, high)] + specials)
+
+        rows = []
+        for _ in range(3000):
+            rows.append((
+                pick(0, 100, [40, 70, 0, 100, 39.99, 70.01]),
+                pick(0, 100, [30, 60, 30.0, 60.0]),
+                pick(0, 100, [50, 0, 100, 25, 75]),
+                pick(-1, 1, [0, 0.3, -0.5, 1, -1]),
+                pick(0, 1, [0, 1, 0.5]),
+                rng.choice(self.TEXTS),
+            ))
+
+        penalties = [
+            calculator.detect_manipulation_patterns(text, scs, {'polarity': pol})['total_penalty']
+            for _, _, scs, pol, _, text in rows
+        ]
+        batch = calculator.calculate_perceived_intent_batch(
+            *zip(*[row[:5] for row in rows]), manipulation_penalty=penalties
+        )
+
+        fields = ['intent_score', 'authenticity', 'manipulation_risk', 'category',
+                  'ambiguity_factor', 'confidence']
+        for i, (emc, nam, scs, pol, subj, text) in enumerate(rows):
+            expected = calculator.calculate_perceived_intent(
+                emc, nam, scs, {'polarity': pol, 'subjectivity': subj}, text
+            )
+            for name in fields:
+                self.assertEqual(
+                    batch[name][i], expected[name],
+                    f"{name} for row {i}: batch {batch[name][i]!r} != scalar {expected[name]!r}"
+                )
+
+
+@unittest.skipUnless(NUMBA_AVAILABLE, "numba not installed")
+@unittest.skipIf(os.environ.get('NUMBA_DISABLE_JIT') == '1', "already running without JIT")
+class TestWithoutJIT(unittest.TestCase):
+    """The same checks with the Numba kernels run as plain Python"""
+
+    def test_suite_passes_without_jit(self):
+        env = dict(os.environ, NUMBA_DISABLE_JIT='1')
+        result = subprocess.run(
+            [sys.executable, os.path.abspath(__file__)],
+            capture_output=True,
+            text=True,
+            env=env
+        )
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()